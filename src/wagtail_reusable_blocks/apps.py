@@ -24,15 +24,53 @@ class WagtailReusableBlocksConfig(AppConfig):
         Note: ReusableBlock snippet registration is now handled in wagtail_hooks.py
         """
         self._validate_settings()
+        self._prewarm_api_class_cache()
+
+        # Registers the cached-template-loader system check
+        from . import checks  # noqa: F401
+
+    def _prewarm_api_class_cache(self) -> None:
+        """Resolve API permission/authentication classes once at startup.
+
+        Skipped silently when djangorestframework (an optional dependency)
+        is not installed.
+        """
+        try:
+            from .api.views import _resolve_classes_cached
+        except ImportError:
+            return
+
+        _resolve_classes_cached("API_PERMISSION_CLASSES")
+        _resolve_classes_cached("API_AUTHENTICATION_CLASSES")
+
+    # Settings validated at startup, as (key, required type) pairs; a table
+    # keeps ready() a single pass as more validated settings are added.
+    _VALIDATED_SETTINGS: tuple[tuple[str, type], ...] = (
+        ("TEMPLATE", str),
+        ("PREVIEW_TEMPLATE", str),
+    )
+
+    # Render-path settings warmed into the get_setting cache at startup so
+    # the first request doesn't pay the settings merge.
+    _PREWARMED_SETTINGS: tuple[str, ...] = (
+        "SLOT_ATTRIBUTE",
+        "SLOT_LABEL_ATTRIBUTE",
+        "MAX_NESTING_DEPTH",
+        "RENDER_CACHE_TIMEOUT",
+    )
 
     def _validate_settings(self) -> None:
         """Validate settings configuration."""
         from .conf import get_setting
 
-        # Validate TEMPLATE setting
-        template = get_setting("TEMPLATE")
-        if template is not None and not isinstance(template, str):
-            raise ImproperlyConfigured(
-                "WAGTAIL_REUSABLE_BLOCKS['TEMPLATE'] must be a string. "
-                f"Got {type(template).__name__} instead."
-            )
+        for key in self._PREWARMED_SETTINGS:
+            get_setting(key)
+
+        for key, required_type in self._VALIDATED_SETTINGS:
+            value = get_setting(key)
+            if value is not None and not isinstance(value, required_type):
+                type_name = "string" if required_type is str else required_type.__name__
+                raise ImproperlyConfigured(
+                    f"WAGTAIL_REUSABLE_BLOCKS['{key}'] must be a {type_name}. "
+                    f"Got {type(value).__name__} instead."
+                )
@@ -18,6 +18,8 @@ except ImportError:
         warnings.simplefilter("ignore", DeprecationWarning)
         from wagtail.telepath import register
 
+from ..utils.render_cache import get_cached_layout_html
+from ..utils.rendering import render_layout_with_slots
 from ..widgets import ReusableLayoutBlockAdapter
 from .slot_fill import SlotFillBlock
 
@@ -115,32 +117,37 @@ class ReusableLayoutBlock(StructBlockType):  # type: ignore[misc]
         Returns:
             Rendered HTML string with slots injected
         """
-        from ..utils.rendering import render_layout_with_slots
+        # No layout chosen yet (common during preview of a fresh block):
+        # nothing to render, so skip the StreamField render entirely
+        if not value or not value.get("layout"):
+            return mark_safe("")
 
         layout = value["layout"]
         slot_content = value.get("slot_content", [])
 
-        # Render the layout to HTML
-        layout_html = layout.content.render_as_block(context)
+        # Render the layout to HTML (cached per (pk, updated_at), so a
+        # snippet reused across many pages is rendered once)
+        layout_html = get_cached_layout_html(layout, context)
 
-        # If no slots to fill, return layout as-is
+        # If no slots to fill, return layout as-is; the cached render is
+        # already a SafeString, so no mark_safe re-wrap is needed
         if not slot_content:
-            return mark_safe(layout_html)
+            return layout_html
 
-        # Convert slot_content StreamField to list of dicts
-        slot_fills = []
+        # Render each slot's content up front and hand the HTML walker a
+        # slot_id -> HTML mapping with O(1) lookups. Children are rendered
+        # and joined individually — render_as_block would wrap each child
+        # in StreamBlock's block-TYPE divs and change the emitted markup.
+        rendered_fills = {}
         for slot_fill_block in slot_content:
             # slot_fill_block is a BoundBlock wrapping SlotFillBlock
             slot_fill_value = slot_fill_block.value
-            slot_fills.append(
-                {
-                    "slot_id": slot_fill_value["slot_id"],
-                    "content": slot_fill_value["content"],  # List of BoundBlocks
-                }
+            rendered_fills[slot_fill_value["slot_id"]] = "".join(
+                str(child.render(context)) for child in slot_fill_value["content"]
             )
 
         # Render with slots
-        return render_layout_with_slots(layout_html, slot_fills, context)
+        return render_layout_with_slots(layout_html, rendered_fills, context)
 
     def get_form_context(self, value, prefix, errors=None):  # type: ignore[no-untyped-def]
         """Add available slots to form context.
@@ -152,14 +159,13 @@ class ReusableLayoutBlock(StructBlockType):  # type: ignore[misc]
 
         # If a layout is selected, we could extract slots here
         # But the dynamic UI (Issue #50) will handle this better
-        if value and value.get("layout"):
-            from ..utils.slot_detection import detect_slots_from_html
-
-            layout = value["layout"]
-            html = layout.content.render_as_block()
-            slots = detect_slots_from_html(html)
-            context["available_slots"] = slots
+        layout = value.get("layout") if value else None
+        if layout is None:
+            return context
 
+        # Slots are detected at save time and stored on the model, so
+        # form loads read a column instead of rendering the StreamField.
+        context["available_slots"] = layout.slot_ids
         return context
 
 
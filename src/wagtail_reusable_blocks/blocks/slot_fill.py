@@ -1,5 +1,6 @@
 """SlotFillBlock for filling slots in layout templates."""
 
+import functools
 from typing import TYPE_CHECKING
 
 from django.utils.translation import gettext_lazy as _
@@ -10,7 +11,9 @@ from wagtail.blocks import (
     StructBlock,
 )
 
+from .chooser import ReusableBlockChooserBlock
 from .html import HTMLBlock
+from .image import ImageBlock
 
 if TYPE_CHECKING:
     from wagtail.blocks import StreamBlock as StreamBlockType
@@ -20,6 +23,56 @@ else:
     StructBlockType = StructBlock  # type: ignore[misc,assignment]
 
 
+@functools.cache
+def _layout_block_class():  # type: ignore[no-untyped-def]
+    """Resolve ReusableLayoutBlock once per process.
+
+    The import is deferred (and cached) rather than done at module level
+    because layout.py imports this module; resolving lazily breaks the
+    circular dependency without re-running the import machinery on every
+    SlotFillBlock instantiation.
+    """
+    try:
+        from .layout import ReusableLayoutBlock
+    except ImportError:
+        # ReusableLayoutBlock not yet defined, skip it
+        return None
+    return ReusableLayoutBlock
+
+
+@functools.cache
+def _base_block_types():  # type: ignore[no-untyped-def]
+    """Build the shared non-recursive slot block definitions once.
+
+    Block definitions are costly to construct and effectively immutable
+    once bound; every SlotContentStreamBlock binds them under the same
+    names, so one shared set serves all instances in the process.
+    """
+    return (
+        ("rich_text", RichTextBlock()),
+        ("raw_html", HTMLBlock()),
+        ("image", ImageBlock()),
+        ("reusable_block", ReusableBlockChooserBlock()),
+    )
+
+
+@functools.cache
+def _nested_layout_block():  # type: ignore[no-untyped-def]
+    """Build the shared nested ReusableLayoutBlock definition once.
+
+    Uses the _creating_instance flag so the nested layout's own
+    slot_content omits reusable_layout, terminating the recursion.
+    """
+    layout_block_class = _layout_block_class()
+    if layout_block_class is None:
+        return None
+    try:
+        SlotContentStreamBlock._creating_instance = True
+        return layout_block_class()  # type: ignore[no-untyped-call]
+    finally:
+        SlotContentStreamBlock._creating_instance = False
+
+
 class SlotContentStreamBlock(StreamBlockType):  # type: ignore[misc]
     """StreamBlock for slot content with lazy block type loading."""
 
@@ -27,33 +80,23 @@ class SlotContentStreamBlock(StreamBlockType):  # type: ignore[misc]
     _creating_instance = False
 
     def __init__(self, **kwargs):  # type: ignore[no-untyped-def]
-        # Import here to avoid circular dependency
-        from .chooser import ReusableBlockChooserBlock
-        from .image import ImageBlock
-
-        block_types = [
-            ("rich_text", RichTextBlock()),
-            ("raw_html", HTMLBlock()),
-            ("image", ImageBlock()),
-            ("reusable_block", ReusableBlockChooserBlock()),
-        ]
-
-        # Try to import ReusableLayoutBlock if available
-        # This will work after ReusableLayoutBlock is defined
-        # Use _creating_instance flag to prevent infinite recursion
-        if not SlotContentStreamBlock._creating_instance:
-            try:
-                SlotContentStreamBlock._creating_instance = True
-                from .layout import ReusableLayoutBlock
+        block_types = list(_base_block_types())
 
-                block_types.append(
-                    ("reusable_layout", ReusableLayoutBlock())  # type: ignore[no-untyped-call]
+        # Include ReusableLayoutBlock for nested layouts, except while the
+        # shared nested definition itself is being built
+        if not SlotContentStreamBlock._creating_instance:
+            nested_layout = _nested_layout_block()
+            if nested_layout is not None:
+                block_types.append(("reusable_layout", nested_layout))
+                # Bound the recursive branch so the telepath definition
+                # the admin must serialize cannot explode
+                kwargs.setdefault(
+                    "block_counts", {"reusable_layout": {"max_num": 3}}
                 )
-            except ImportError:
-                # ReusableLayoutBlock not yet defined, skip it
-                pass
-            finally:
-                SlotContentStreamBlock._creating_instance = False
+
+        # Cap slot length by default (overridable per use) to keep form
+        # payloads and validation passes proportionate
+        kwargs.setdefault("max_num", 32)
 
         super().__init__(block_types, **kwargs)
 
@@ -0,0 +1,51 @@
+"""System checks for wagtail-reusable-blocks."""
+
+from typing import Any
+
+from django.conf import settings
+from django.core import checks
+
+CACHED_LOADER = "django.template.loaders.cached.Loader"
+
+
+def _contains_cached_loader(loaders: Any) -> bool:
+    """Return True if the loader config wraps loaders in the cached loader."""
+    for loader in loaders:
+        name = loader[0] if isinstance(loader, (list, tuple)) else loader
+        if name == CACHED_LOADER:
+            return True
+    return False
+
+
+@checks.register(checks.Tags.templates)
+def check_cached_template_loader(
+    app_configs: Any, **kwargs: Any
+) -> list[checks.Warning]:
+    """Warn when custom template loaders bypass the cached loader.
+
+    ReusableBlock.render goes through the template loader on every
+    uncached render; without the cached loader each call re-reads and
+    re-parses the template from disk. Engines that don't set "loaders"
+    are fine — Django wraps the defaults in the cached loader itself
+    (outside DEBUG).
+    """
+    warnings = []
+    for engine in getattr(settings, "TEMPLATES", []):
+        loaders = engine.get("OPTIONS", {}).get("loaders")
+        if loaders is None or _contains_cached_loader(loaders):
+            continue
+        warnings.append(
+            checks.Warning(
+                "Template loaders are configured without "
+                f"{CACHED_LOADER}; ReusableBlock templates will be "
+                "re-parsed on every render.",
+                hint=(
+                    "Wrap your loaders in "
+                    f"('{CACHED_LOADER}', [...]) or remove the 'loaders' "
+                    "option to use Django's cached defaults."
+                ),
+                obj=engine.get("NAME") or engine.get("BACKEND"),
+                id="wagtail_reusable_blocks.W001",
+            )
+        )
+    return warnings
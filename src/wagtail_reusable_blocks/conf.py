@@ -1,8 +1,11 @@
 """Configuration and settings for wagtail-reusable-blocks."""
 
+import functools
 from typing import Any
 
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 
 # Default settings
 DEFAULTS = {
@@ -15,6 +18,11 @@ DEFAULTS = {
     "SLOT_LABEL_ATTRIBUTE": "data-slot-label",
     # v0.5.0 settings - Preview
     "PREVIEW_TEMPLATE": "wagtail_reusable_blocks/preview.html",
+    # Render caching
+    "RENDER_CACHE_TIMEOUT": 3600,
+    # Slug generation: dotted path to a slugify callable, or None for
+    # Django's slugify (memoized)
+    "SLUGIFY_BACKEND": None,
     # v0.8.0 settings - API
     "API_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
@@ -23,6 +31,20 @@ DEFAULTS = {
 }
 
 
+@functools.lru_cache(maxsize=1)
+def _merged_settings() -> tuple[dict[str, Any], frozenset[str]]:
+    """Merge DEFAULTS with the user's WAGTAIL_REUSABLE_BLOCKS, once.
+
+    Settings are immutable at runtime, so the getattr + dict merge is paid
+    a single time per process instead of on every get_setting call. The
+    set of user-provided keys is kept alongside so explicit call-site
+    defaults can still take precedence over DEFAULTS.
+    """
+    user_settings = getattr(settings, "WAGTAIL_REUSABLE_BLOCKS", {})
+    return {**DEFAULTS, **user_settings}, frozenset(user_settings)
+
+
+@functools.lru_cache(maxsize=32)
 def get_setting(key: str, default: Any = None) -> Any:
     """
     Get a setting from Django settings or return default value.
@@ -38,9 +60,18 @@ def get_setting(key: str, default: Any = None) -> Any:
         >>> get_setting('TEMPLATE')
         'wagtail_reusable_blocks/reusable_block.html'
     """
-    user_settings = getattr(settings, "WAGTAIL_REUSABLE_BLOCKS", {})
+    merged, user_keys = _merged_settings()
+
+    # A provided default overrides DEFAULTS, but never a user setting
+    if default is not None and key not in user_keys:
+        return default
+
+    return merged.get(key, default)
 
-    # Use provided default, or fall back to DEFAULTS
-    fallback = default if default is not None else DEFAULTS.get(key)
 
-    return user_settings.get(key, fallback)
+@receiver(setting_changed)
+def _clear_setting_cache(sender: Any, setting: str, **kwargs: Any) -> None:
+    """Drop cached values when WAGTAIL_REUSABLE_BLOCKS changes (override_settings)."""
+    if setting == "WAGTAIL_REUSABLE_BLOCKS":
+        _merged_settings.cache_clear()
+        get_setting.cache_clear()
@@ -0,0 +1,38 @@
+from django.db import migrations
+
+# The ?search= filter uses name__icontains, which defeats B-tree indexes
+# (leading wildcard). On PostgreSQL a pg_trgm GIN index lets icontains use
+# an index scan instead of a full table scan. Other backends keep the
+# current behavior; the operations below are no-ops there.
+
+INDEX_NAME = "wrb_name_trgm"
+TABLE_NAME = "wagtail_reusable_blocks_reusableblock"
+
+
+def create_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(
+        f"CREATE INDEX IF NOT EXISTS {INDEX_NAME} "
+        f"ON {TABLE_NAME} USING gin (name gin_trgm_ops)"
+    )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(f"DROP INDEX IF EXISTS {INDEX_NAME}")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        (
+            "wagtail_reusable_blocks",
+            "0006_alter_reusableblock_content_alter_reusableblock_name_and_more",
+        ),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.17 on 2026-08-28 14:08
+
+from django.db import migrations, models
+
+
+def backfill_slot_ids(apps, schema_editor):
+    """Populate slot_ids for rows saved before the field existed."""
+    from wagtail_reusable_blocks.utils.slot_detection import detect_slots_from_html
+
+    ReusableBlock = apps.get_model("wagtail_reusable_blocks", "ReusableBlock")
+    for block in ReusableBlock.objects.all().iterator():
+        try:
+            html = str(block.content.render_as_block())
+        except Exception:
+            continue
+        block.slot_ids = list(detect_slots_from_html(html))
+        block.save(update_fields=["slot_ids"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wagtail_reusable_blocks', '0007_add_name_trigram_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='reusableblock',
+            name='slot_ids',
+            field=models.JSONField(blank=True, default=list, editable=False, help_text='Detected slot metadata, refreshed automatically on save', verbose_name='slot ids'),
+        ),
+        migrations.RunPython(backfill_slot_ids, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.17 on 2026-08-28 14:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wagtail_reusable_blocks', '0008_reusableblock_slot_ids'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='reusableblock',
+            index=models.Index(fields=['-updated_at'], name='wagtail_reu_updated_cd211f_idx'),
+        ),
+    ]
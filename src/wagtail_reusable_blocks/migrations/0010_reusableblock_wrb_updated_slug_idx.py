@@ -0,0 +1,17 @@
+# Generated by Django 5.2.17 on 2026-08-28 14:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wagtail_reusable_blocks', '0009_reusableblock_wagtail_reu_updated_cd211f_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='reusableblock',
+            index=models.Index(fields=['-updated_at', 'slug'], name='wrb_updated_slug_idx'),
+        ),
+    ]
@@ -1,5 +1,5 @@
 """Models for wagtail-reusable-blocks."""
 
-from .reusable_block import ReusableBlock
+from .reusable_block import ReusableBlock, ReusableBlockManager, render_many
 
-__all__ = ["ReusableBlock"]
+__all__ = ["ReusableBlock", "ReusableBlockManager", "render_many"]
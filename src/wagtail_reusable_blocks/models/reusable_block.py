@@ -1,11 +1,19 @@
 """ReusableBlock model for wagtail-reusable-blocks."""
 
+import collections
+import functools
+import threading
 from typing import TYPE_CHECKING, Any
 
 from django.contrib.contenttypes.fields import GenericRelation
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
+from django.core.signals import setting_changed
 from django.db import models
-from django.template.loader import render_to_string
+from django.dispatch import receiver
+from django.template import TemplateDoesNotExist
+from django.template.loader import get_template
+from django.utils.module_loading import import_string
 from django.utils.safestring import SafeString, mark_safe
 from django.utils.text import slugify
 from django.utils.translation import gettext
@@ -24,10 +32,110 @@ from wagtail.models import (
 from wagtail.search import index
 from wagtail.snippets.blocks import SnippetChooserBlock
 
+from ..conf import get_setting
+
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from django.template.context import Context
 
 
+# slugify is a pure function; memoize it so bulk imports and repeated
+# saves of recurring names skip the regex work.
+_slugify = functools.lru_cache(maxsize=1024)(slugify)
+
+
+@functools.lru_cache(maxsize=4)
+def _resolve_slugifier(backend: str | None) -> Any:
+    """Resolve the configured slugify callable once per backend path.
+
+    Projects with heavy bulk imports can point SLUGIFY_BACKEND at a
+    faster implementation; the default is Django's slugify, memoized.
+    """
+    if backend is None:
+        return _slugify
+    return import_string(backend)
+
+
+# In-process L1 for context-free renders, in front of the Django cache
+# (L2): keys rotate with updated_at, so stale entries age out of the LRU
+# and no network round-trip is paid on hot blocks.
+_RENDER_LOCAL: "collections.OrderedDict[tuple[Any, ...], SafeString]" = (
+    collections.OrderedDict()
+)
+_RENDER_LOCAL_MAX = 512
+_render_local_lock = threading.Lock()
+
+
+def _render_local_get(key: tuple[Any, ...]) -> SafeString | None:
+    """Return a locally cached render, refreshing its LRU position."""
+    with _render_local_lock:
+        html = _RENDER_LOCAL.get(key)
+        if html is not None:
+            _RENDER_LOCAL.move_to_end(key)
+        return html
+
+
+def _render_local_set(key: tuple[Any, ...], html: SafeString) -> None:
+    """Store a rendered fragment locally, evicting the oldest entry."""
+    with _render_local_lock:
+        _RENDER_LOCAL[key] = html
+        _RENDER_LOCAL.move_to_end(key)
+        if len(_RENDER_LOCAL) > _RENDER_LOCAL_MAX:
+            _RENDER_LOCAL.popitem(last=False)
+
+
+# Resolved Template objects per template name: skips the engine lookup
+# layer that render_to_string performs on every call. Cleared on
+# setting_changed so override_settings(TEMPLATES=...) keeps working.
+_template_cache: dict[str, Any] = {}
+
+
+def _get_cached_template(template_name: str) -> Any:
+    """Resolve a template once per process, through the loader machinery."""
+    tmpl = _template_cache.get(template_name)
+    if tmpl is None:
+        tmpl = get_template(template_name)
+        _template_cache[template_name] = tmpl
+    return tmpl
+
+
+@receiver(setting_changed)
+def _clear_template_cache(sender: Any, setting: str, **kwargs: Any) -> None:
+    """Drop resolved templates when template-affecting settings change."""
+    if setting in {"TEMPLATES", "DEBUG", "WAGTAIL_REUSABLE_BLOCKS"}:
+        _template_cache.clear()
+        with _render_local_lock:
+            _RENDER_LOCAL.clear()
+
+
+class ReusableBlockManager(models.Manager):
+    """Manager with query helpers for bulk ReusableBlock fetches."""
+
+    def for_render(self) -> "models.QuerySet[ReusableBlock]":
+        """Return a queryset loading only the fields rendering needs.
+
+        Defers slot_ids and the revision/workflow relations; listings and
+        multi-block renders only touch identity, content and the
+        updated_at cache key. Subclasses whose content holds ForeignKey
+        blocks (e.g. an ImageChooserBlock) should override this to add
+        the matching prefetch_related calls.
+        """
+        return self.get_queryset().only(
+            "id", "slug", "name", "content", "updated_at"
+        )
+
+
+def render_many(blocks: "Iterable[ReusableBlock]") -> "dict[int, SafeString]":
+    """Render several blocks, returning {pk: html}.
+
+    Context-free renders go through the per-(pk, updated_at) render
+    cache, so repeated calls across a request set amortize template
+    resolution and StreamField rendering to one pass per block.
+    """
+    return {block.pk: block.render() for block in blocks}
+
+
 # Determine base class for HTML editing block
 try:
     from wagtail_html_editor.blocks import (  # type: ignore[import-not-found]
@@ -100,9 +208,6 @@ class _ReusableBlockChooserBlock(SnippetChooserBlock):  # type: ignore[misc]
         if context is None:
             context = {}
 
-        # Import here to avoid circular imports
-        from ..conf import get_setting
-
         # Track nesting depth to prevent infinite recursion
         current_depth = context.get("_reusable_block_depth", 0)
         max_depth = get_setting("MAX_NESTING_DEPTH")
@@ -228,9 +333,18 @@ class ReusableBlock(
         verbose_name=_("content"),
         help_text=_("The content of this reusable block"),
     )
+    slot_ids = models.JSONField(
+        _("slot ids"),
+        default=list,
+        blank=True,
+        editable=False,
+        help_text=_("Detected slot metadata, refreshed automatically on save"),
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ReusableBlockManager()
+
     # GenericRelation for revisions (required for RevisionMixin)
     _revisions = GenericRelation(
         "wagtailcore.Revision",
@@ -279,6 +393,15 @@ class ReusableBlock(
         verbose_name_plural = _("Reusable Blocks")
         indexes = [
             models.Index(fields=["slug"]),
+            # Meta.ordering sorts every listing by -updated_at; an index
+            # turns that into an index scan instead of a full table sort.
+            models.Index(fields=["-updated_at"]),
+            # Covers "newest N" listings that also read the slug, keeping
+            # ORDER BY updated_at DESC LIMIT N index-only.
+            models.Index(
+                fields=["-updated_at", "slug"],
+                name="wrb_updated_slug_idx",
+            ),
         ]
 
     def __str__(self) -> str:
@@ -291,14 +414,35 @@ class ReusableBlock(
         Raises:
             ValidationError: If circular reference is detected.
         """
+        # Any blank slug is refilled; the slugifier (and its backend
+        # resolution) is only paid on that path.
         if not self.slug:
-            self.slug = slugify(self.name)
+            self.slug = _resolve_slugifier(get_setting("SLUGIFY_BACKEND"))(self.name)
 
         # Validate for circular references before saving
         self.clean()
 
+        # Detect slots once at write time so read paths (admin form loads)
+        # can use the stored column instead of re-rendering the StreamField.
+        self.slot_ids = self._detect_slot_ids()
+
         super().save(*args, **kwargs)
 
+    def _detect_slot_ids(self) -> list[Any]:
+        """Render the content StreamField and detect its slots.
+
+        Returns:
+            List of SlotInfo dicts, or an empty list if rendering fails.
+        """
+        # Import here to avoid circular imports
+        from ..utils.slot_detection import detect_slots_from_html
+
+        try:
+            html = str(self.content.render_as_block())
+        except Exception:
+            return []
+        return list(detect_slots_from_html(html))
+
     def clean(self) -> None:
         """Validate the model for circular references.
 
@@ -477,18 +621,73 @@ class ReusableBlock(
             >>> # With custom template
             >>> html = block.render(template='custom/template.html')
         """
-        from django.template import TemplateDoesNotExist
-
-        from ..conf import get_setting
-
         template_name = template or get_setting("TEMPLATE")
 
-        # Convert context to dict if needed (handles both dict and Context)
-        render_context: dict[str, Any] = dict(context) if context else {}
-        render_context["block"] = self
+        # Context-free renders depend only on the stored content and the
+        # template, so they are cached keyed on (pk, updated_at, template);
+        # auto_now on updated_at rotates the key on save. Renders with a
+        # caller context are not cached — the context may change the output.
+        cache_key = None
+        local_key = None
+        if not context and self.pk is not None and self.updated_at is not None:
+            # L1: in-process LRU, no serialization or network round-trip
+            local_key = (self.pk, self.updated_at.isoformat(), template_name)
+            # L1 entries are stored as SafeString, so hits re-wrap nothing
+            local = _render_local_get(local_key)
+            if local is not None:
+                return local
+
+            # L2: Django cache, shared across processes
+            cache_key = (
+                f"wrb:render:{self.pk}:"
+                f"{self.updated_at.isoformat()}:{template_name}"
+            )
+            cached = cache.get(cache_key)
+            if cached is not None:
+                safe_cached = mark_safe(cached)
+                _render_local_set(local_key, safe_cached)
+                return safe_cached
 
         try:
-            return mark_safe(render_to_string(template_name, render_context))
+            tmpl = _get_cached_template(template_name)
+            if not context:
+                html = tmpl.render({"block": self})
+            elif isinstance(context, dict):
+                # Inject "block" in place instead of copying the caller's
+                # dict; any previous binding is restored before returning.
+                sentinel = object()
+                previous = context.get("block", sentinel)
+                context["block"] = self
+                try:
+                    html = tmpl.render(context)
+                finally:
+                    if previous is sentinel:
+                        del context["block"]
+                    else:
+                        context["block"] = previous
+            else:
+                # Django Context (or other mapping): flatten once to the
+                # plain dict the template backend requires
+                render_context: dict[str, Any] = (
+                    context.flatten()
+                    if hasattr(context, "flatten")
+                    else dict(context)
+                )
+                render_context["block"] = self
+                html = tmpl.render(render_context)
+            # Template engines return SafeString already; only wrap when a
+            # backend hands back a plain str, saving an allocation per call
+            safe_html: SafeString = (
+                html if isinstance(html, SafeString) else mark_safe(html)
+            )
+            if cache_key is not None:
+                _render_local_set(local_key, safe_html)
+                cache.set(
+                    cache_key,
+                    str(safe_html),
+                    timeout=get_setting("RENDER_CACHE_TIMEOUT"),
+                )
+            return safe_html
         except TemplateDoesNotExist as e:
             # Provide helpful error message
             if template:
@@ -525,8 +724,6 @@ class ReusableBlock(
         Returns:
             Template path for rendering preview.
         """
-        from ..conf import get_setting
-
         return str(get_setting("PREVIEW_TEMPLATE"))
 
     def get_preview_context(
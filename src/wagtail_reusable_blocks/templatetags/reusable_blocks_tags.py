@@ -1,24 +1,81 @@
 """Template tags and filters for wagtail-reusable-blocks."""
 
-import os
+import functools
+import re
+import sys
 from typing import Any
 
 from django import template
 
 register = template.Library()
 
+# Anchored scan from the right in C, instead of os.path.splitext's
+# Python-level separator walk and tuple allocation.
+_EXT_RE = re.compile(r"\.([A-Za-z0-9]{1,5})$")
+
+
+@functools.lru_cache(maxsize=1024)
+def _ext_lower(name: str) -> str:
+    """Return the lowercased extension of a filename, without the dot.
+
+    The result is interned so template equality comparisons against
+    literals resolve by identity. Memoized: listing pages hit the same
+    filenames repeatedly.
+    """
+    m = _EXT_RE.search(name)
+    return sys.intern(m.group(1).lower()) if m else ""
+
+
+@register.filter
+def image_format(image: Any) -> str:
+    """Return an image's file format as a canonical extension string.
+
+    Fuses per-format checks into one filename traversal; templates
+    compare with ``{% if image|image_format == "gif" %}``.
+
+    Args:
+        image: A Wagtail Image instance
+
+    Returns:
+        The lowercased extension without the dot (e.g. "gif"), or ""
+        when the image or its file is missing.
+    """
+    file = getattr(image, "file", None) if image else None
+    if not file:
+        return ""
+    name = file.name
+    return _ext_lower(name) if name else ""
+
+
+@register.simple_tag
+def image_flags(image: Any) -> dict[str, Any]:
+    """Resolve all format flags for an image in one template call.
+
+    Loops over many images pay Variable.resolve plus filter lookup per
+    filter invocation; ``{% image_flags image as flags %}`` resolves the
+    image once and exposes ``flags.ext`` and ``flags.is_gif``.
+
+    Args:
+        image: A Wagtail Image instance
+
+    Returns:
+        Dict with "ext" (canonical extension, "" when unknown) and
+        "is_gif".
+    """
+    ext = image_format(image)
+    return {"ext": ext, "is_gif": ext == "gif"}
+
 
 @register.filter
 def is_gif(image: Any) -> bool:
     """Check if an image is a GIF file.
 
+    Thin wrapper over image_format, kept for backward compatibility.
+
     Args:
         image: A Wagtail Image instance
 
     Returns:
         True if the image is a GIF file, False otherwise
     """
-    if not image or not hasattr(image, "file") or not image.file:
-        return False
-    _, ext = os.path.splitext(image.file.name)
-    return bool(ext.lower() == ".gif")
+    return image_format(image) == "gif"
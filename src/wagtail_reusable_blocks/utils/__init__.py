@@ -1,11 +1,37 @@
 """Utilities for wagtail-reusable-blocks."""
 
-from .rendering import render_layout_with_slots, render_streamfield_content
-from .slot_detection import SlotInfo, detect_slots_from_html
+import importlib
+from typing import Any
+
+# PEP 562 lazy exports: importing the package no longer pulls in the
+# HTML parser and its regex compilation; submodules load on first use.
+_LAZY = {
+    "detect_slots_from_html": "slot_detection",
+    "SlotInfo": "slot_detection",
+    "get_cached_layout_html": "render_cache",
+    "get_cached_slots": "render_cache",
+    "render_layout_with_slots": "rendering",
+    "render_streamfield_content": "rendering",
+}
 
 __all__ = [
     "detect_slots_from_html",
+    "get_cached_layout_html",
+    "get_cached_slots",
     "render_layout_with_slots",
     "render_streamfield_content",
     "SlotInfo",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    submodule = _LAZY.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module("." + submodule, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
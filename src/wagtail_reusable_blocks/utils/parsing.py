@@ -0,0 +1,45 @@
+"""Memoized HTML parsing for the slot injection hot path."""
+
+import copy
+import functools
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+
+@functools.lru_cache(maxsize=8)
+def slot_strainer(slot_attr: str) -> SoupStrainer:
+    """Return the compiled matcher for elements carrying slot_attr.
+
+    Building a SoupStrainer compiles the attribute match once; sharing it
+    across detection, parsing and injection saves a per-call rebuild.
+    """
+    return SoupStrainer(attrs={slot_attr: True})
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_cached(layout_html: str, slot_attr: str) -> tuple[BeautifulSoup, frozenset[str]]:
+    """Parse layout HTML once per (html, slot_attr), with its slot ids."""
+    soup = BeautifulSoup(layout_html, "html.parser")
+    slot_ids = frozenset(
+        str(element[slot_attr]) for element in soup.find_all(slot_strainer(slot_attr))
+    )
+    return soup, slot_ids
+
+
+def layout_slot_ids(layout_html: str, slot_attr: str) -> frozenset[str]:
+    """Return the slot ids present in layout_html (memoized).
+
+    Lets callers decide whether injection is needed at all without
+    building (or cloning) a mutable tree.
+    """
+    return _parse_cached(layout_html, slot_attr)[1]
+
+
+def parse_layout(layout_html: str, slot_attr: str) -> BeautifulSoup:
+    """Return a mutable parse tree for layout_html.
+
+    The underlying tree is memoized and cloned per call — callers mutate
+    the tree during slot injection, and cloning an existing tree skips
+    re-tokenizing the HTML on every render of the same layout.
+    """
+    return copy.copy(_parse_cached(layout_html, slot_attr)[0])
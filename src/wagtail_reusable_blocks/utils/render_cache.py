@@ -0,0 +1,110 @@
+"""Caching for rendered layout HTML and detected slots.
+
+A ReusableBlock used as a layout template is rendered on every page that
+references it, and rendered again in the admin just to enumerate its
+slots. The rendered HTML and the detected slot list depend only on the
+block's stored content, so both are cached keyed on (pk, updated_at) —
+``updated_at`` is ``auto_now=True``, so every save produces a fresh key
+and stale entries simply age out of the cache.
+"""
+
+import threading
+from typing import TYPE_CHECKING, Any
+
+from django.core.cache import cache
+from django.core.signals import request_finished, request_started
+from django.dispatch import receiver
+from django.utils.safestring import SafeString, mark_safe
+
+from .slot_detection import SlotInfo, detect_slots_from_html
+
+if TYPE_CHECKING:
+    from django.template.context import Context
+
+    from ..models import ReusableBlock
+
+# Entries are invalidated by key rotation, not deletion; a timeout bounds
+# how long orphaned entries linger.
+CACHE_TIMEOUT = 3600
+
+
+# Per-request memo for layout HTML: a snippet reused several times on one
+# page renders once per request even when the shared cache backend is a
+# no-op (e.g. DummyCache). Keyed like the shared cache, so it needs no
+# invalidation beyond the request boundary.
+_request_local = threading.local()
+
+
+@receiver(request_started)
+def _start_request_cache(sender: Any, **kwargs: Any) -> None:
+    """Open a fresh per-request layout memo."""
+    _request_local.layouts = {}
+
+
+@receiver(request_finished)
+def _drop_request_cache(sender: Any, **kwargs: Any) -> None:
+    """Release the per-request layout memo."""
+    _request_local.layouts = None
+
+
+def _cache_key(layout: "ReusableBlock", kind: str) -> str:
+    return f"wrb:layout:{kind}:{layout.pk}:{layout.updated_at.isoformat()}"
+
+
+def get_cached_layout_html(
+    layout: "ReusableBlock",
+    context: "dict[str, Any] | Context | None" = None,
+) -> SafeString:
+    """Return the rendered HTML of a layout's content StreamField.
+
+    On a cache miss the StreamField is rendered and stored; subsequent
+    calls for the same (pk, updated_at) return the stored HTML without
+    touching the block tree.
+
+    Args:
+        layout: The ReusableBlock whose content to render
+        context: Template context passed through on a cache miss
+
+    Returns:
+        Rendered HTML as a SafeString, so callers on the no-injection
+        fast path can return it without re-wrapping in mark_safe
+    """
+    if layout.pk is None:
+        # Unsaved instances have no stable cache identity.
+        return mark_safe(str(layout.content.render_as_block(context)))
+
+    key = _cache_key(layout, "html")
+    request_memo: dict[str, str] | None = getattr(_request_local, "layouts", None)
+    if request_memo is not None and key in request_memo:
+        return mark_safe(request_memo[key])
+
+    html: str | None = cache.get(key)
+    if html is None:
+        html = str(layout.content.render_as_block(context))
+        cache.set(key, html, timeout=CACHE_TIMEOUT)
+    if request_memo is not None:
+        request_memo[key] = html
+    return mark_safe(html)
+
+
+def get_cached_slots(layout: "ReusableBlock") -> list[SlotInfo]:
+    """Return the detected slots of a layout, cached alongside its HTML.
+
+    The admin form path calls this instead of re-rendering the layout and
+    re-parsing the result on every form load.
+
+    Args:
+        layout: The ReusableBlock to detect slots in
+
+    Returns:
+        List of SlotInfo dicts (see detect_slots_from_html)
+    """
+    if layout.pk is None:
+        return detect_slots_from_html(get_cached_layout_html(layout))
+
+    key = _cache_key(layout, "slots")
+    slots: list[SlotInfo] | None = cache.get(key)
+    if slots is None:
+        slots = detect_slots_from_html(get_cached_layout_html(layout))
+        cache.set(key, slots, timeout=CACHE_TIMEOUT)
+    return slots
@@ -6,6 +6,7 @@ from bs4 import BeautifulSoup
 from django.utils.safestring import SafeString, mark_safe
 
 from ..conf import get_setting
+from .parsing import layout_slot_ids, parse_layout, slot_strainer
 
 if TYPE_CHECKING:
     from django.template.context import Context
@@ -13,7 +14,7 @@ if TYPE_CHECKING:
 
 def render_layout_with_slots(
     layout_html: str,
-    slot_fills: list[dict[str, Any]],
+    slot_fills: "dict[str, str] | list[dict[str, Any]]",
     context: "dict[str, Any] | Context | None" = None,
 ) -> SafeString:
     """Render a layout with slots filled.
@@ -23,7 +24,8 @@ def render_layout_with_slots(
 
     Args:
         layout_html: Rendered HTML of the layout ReusableBlock
-        slot_fills: List of dicts with 'slot_id' and 'content' (BoundBlocks)
+        slot_fills: Mapping of slot_id to pre-rendered HTML, or a list of
+            dicts with 'slot_id' and 'content' (BoundBlocks) rendered here
         context: Template context to pass to slot content rendering
 
     Returns:
@@ -31,36 +33,41 @@ def render_layout_with_slots(
 
     Example:
         >>> layout_html = '<div data-slot="main"><p>Default</p></div>'
-        >>> slot_fills = [{
-        ...     'slot_id': 'main',
-        ...     'content': [rich_text_block]  # BoundBlock instances
-        ... }]
+        >>> slot_fills = {'main': '<p>Rendered content</p>'}
         >>> html = render_layout_with_slots(layout_html, slot_fills)
         >>> # Returns: '<div data-slot="main"><p>Rendered content</p></div>'
     """
     slot_attr = get_setting("SLOT_ATTRIBUTE")
 
-    # Parse HTML
-    soup = BeautifulSoup(layout_html, "html.parser")
-
-    # Create slot_id -> rendered content mapping
-    slot_map: dict[str, str] = {}
-    for fill in slot_fills:
-        slot_id = fill["slot_id"]
-        content_blocks = fill["content"]
-
-        # Render each block in the content StreamField
-        rendered_parts = []
-        for block_data in content_blocks:
-            # block_data is a BoundBlock from StreamField
-            rendered = block_data.render(context)
-            rendered_parts.append(str(rendered))
-
-        # Combine all rendered parts
-        slot_map[slot_id] = "".join(rendered_parts)
+    # Nothing to inject, or no slot elements to inject into: skip the
+    # parse/serialize round-trip and hand the layout back untouched.
+    if not slot_fills or slot_attr not in layout_html:
+        return mark_safe(layout_html)
+
+    # The memoized slot index answers "does any fill target a real slot?"
+    # without building a mutable tree.
+    present_ids = layout_slot_ids(layout_html, slot_attr)
+    if isinstance(slot_fills, dict):
+        # Pre-rendered by the caller (slot_id -> HTML)
+        slot_map: dict[str, str] = slot_fills
+    else:
+        # Legacy shape: render each slot's BoundBlocks here, skipping
+        # fills that target slots absent from this layout
+        slot_map = {
+            fill["slot_id"]: "".join(
+                str(block_data.render(context)) for block_data in fill["content"]
+            )
+            for fill in slot_fills
+            if fill["slot_id"] in present_ids
+        }
+    if not present_ids.intersection(slot_map):
+        return mark_safe(layout_html)
+
+    # Clone the memoized parse tree instead of re-tokenizing the HTML
+    soup = parse_layout(layout_html, slot_attr)
 
     # Find and replace slot elements
-    for element in soup.find_all(attrs={slot_attr: True}):
+    for element in soup.find_all(slot_strainer(slot_attr)):
         slot_id = str(element[slot_attr])
 
         if slot_id in slot_map:
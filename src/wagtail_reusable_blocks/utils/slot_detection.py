@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, TypedDict
 from bs4 import BeautifulSoup
 
 from ..conf import get_setting
+from .parsing import slot_strainer
 
 if TYPE_CHECKING:
     pass
@@ -64,11 +65,18 @@ def detect_slots_from_html(html: str) -> list[SlotInfo]:
     slot_attr = get_setting("SLOT_ATTRIBUTE")
     label_attr = get_setting("SLOT_LABEL_ATTRIBUTE")
 
-    soup = BeautifulSoup(html, "html.parser")
+    # Cheap substring check before involving the parser at all: layouts
+    # without slots are common and don't need a tree build.
+    if slot_attr not in html:
+        return []
+
+    # Restrict tree building to slot elements (and their subtrees) so the
+    # parser skips the rest of the document instead of materializing it.
+    soup = BeautifulSoup(html, "html.parser", parse_only=slot_strainer(slot_attr))
     slots: list[SlotInfo] = []
 
     # Find all elements with the slot attribute
-    for element in soup.find_all(attrs={slot_attr: True}):
+    for element in soup.find_all(slot_strainer(slot_attr)):
         slot_id = str(element[slot_attr])
 
         # Get label from data-slot-label attribute, or use slot_id as fallback
@@ -3,6 +3,8 @@
 import json
 from typing import TYPE_CHECKING
 
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from django.urls import include, path, reverse
 from django.utils.safestring import mark_safe
 from django.utils.translation import gettext_lazy as _
@@ -85,15 +87,53 @@ class ReusableBlockViewSet(SnippetViewSetType):  # type: ignore[misc]
     preview_enabled = True
 
 
+def _should_register_default_snippet() -> bool:
+    """Return whether the default ReusableBlock snippet should register.
+
+    Split out so tests can exercise the conditional without reloading
+    this module (which would re-run every hook registration).
+    """
+    return bool(get_setting("REGISTER_DEFAULT_SNIPPET"))
+
+
 # Register the custom viewset only if default registration is enabled
 # This prevents double registration
-if get_setting("REGISTER_DEFAULT_SNIPPET"):
+if _should_register_default_snippet():
     register_snippet(ReusableBlockViewSet)
 
 
 BLOCK_ID_PLACEHOLDER = "__BLOCK_ID__"
 BLOCK_ID_PLACEHOLDER_INT = 0
 
+# Script tag built once per process: reverse() walks the URL resolver,
+# which is measurable on every admin page view. Reset via setting_changed
+# when the URL conf (or admin base URL) changes under override_settings.
+_config_script: str | None = None
+
+
+def _build_config_script() -> str:
+    """Build the wagtailReusableBlocksConfig script tag."""
+    slots_url_template = reverse(
+        "wagtail_reusable_blocks:block_slots",
+        kwargs={"block_id": BLOCK_ID_PLACEHOLDER_INT},
+    ).replace(f"/{BLOCK_ID_PLACEHOLDER_INT}/", f"/{BLOCK_ID_PLACEHOLDER}/", 1)
+    # Compact separators and no ASCII-escaping loop: fewer bytes on
+    # every admin page, and the payload is built once per process anyway
+    config = json.dumps(
+        {"slotsUrlTemplate": slots_url_template},
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return mark_safe(f"<script>window.wagtailReusableBlocksConfig={config};</script>")  # noqa: S308
+
+
+@receiver(setting_changed)
+def _reset_config_script(sender: object, setting: str, **kwargs: object) -> None:
+    """Drop the cached script when URL-affecting settings change."""
+    global _config_script
+    if setting in {"ROOT_URLCONF", "FORCE_SCRIPT_NAME", "WAGTAILADMIN_BASE_URL"}:
+        _config_script = None
+
 
 @hooks.register("insert_global_admin_js")  # type: ignore[untyped-decorator]
 def inject_reusable_blocks_config() -> str:
@@ -102,12 +142,10 @@ def inject_reusable_blocks_config() -> str:
     Provides a URL template so slot-chooser.js can build correct fetch URLs
     regardless of WAGTAIL_ADMIN_URL_PATH customization.
     """
-    slots_url_template = reverse(
-        "wagtail_reusable_blocks:block_slots",
-        kwargs={"block_id": BLOCK_ID_PLACEHOLDER_INT},
-    ).replace(f"/{BLOCK_ID_PLACEHOLDER_INT}/", f"/{BLOCK_ID_PLACEHOLDER}/", 1)
-    config = json.dumps({"slotsUrlTemplate": slots_url_template})
-    return mark_safe(f"<script>window.wagtailReusableBlocksConfig={config};</script>")  # noqa: S308
+    global _config_script
+    if _config_script is None:
+        _config_script = _build_config_script()
+    return _config_script
 
 
 @hooks.register("register_admin_urls")  # type: ignore[untyped-decorator]
@@ -1,7 +1,8 @@
 """Custom widgets for wagtail-reusable-blocks."""
 
+from typing import ClassVar
+
 from django import forms
-from django.utils.functional import cached_property
 from wagtail.blocks.struct_block import StructBlockAdapter
 
 
@@ -13,11 +14,22 @@ class ReusableLayoutBlockAdapter(StructBlockAdapter):  # type: ignore[misc]
 
     js_constructor = "wagtail_reusable_blocks.blocks.ReusableLayoutBlock"
 
-    @cached_property
+    # Static asset list shared by all adapter instances.
+    _SLOT_JS = ["wagtail_reusable_blocks/js/slot-chooser.js"]
+
+    # Merged Media cached per class: Wagtail walks .media for every block
+    # during form rendering, so the merge is paid once per process
+    # instead of once per adapter instance.
+    _merged_media: ClassVar[forms.Media | None] = None
+
+    @property
     def media(self):  # type: ignore[no-untyped-def]
         """Include slot chooser JavaScript."""
-        structblock_media = super().media
-        return forms.Media(
-            js=structblock_media._js + ["wagtail_reusable_blocks/js/slot-chooser.js"],
-            css=structblock_media._css,
-        )
+        cls = type(self)
+        if "_merged_media" not in cls.__dict__ or cls._merged_media is None:
+            structblock_media = super().media
+            cls._merged_media = forms.Media(
+                js=structblock_media._js + cls._SLOT_JS,
+                css=structblock_media._css,
+            )
+        return cls._merged_media
@@ -2,13 +2,69 @@
 Pytest configuration and fixtures for wagtail-reusable-blocks tests.
 """
 
+import itertools
+import json
+import uuid
+
 import pytest
 from django.contrib.auth import get_user_model
+from django.utils.text import slugify
 from wagtail.models import Page, Site
 
+from wagtail_reusable_blocks.models import ReusableBlock
+
 User = get_user_model()
 
 
+def raw_stream_content(html, block_type="rich_text"):
+    """Pre-serialized single-block StreamField payload for the given HTML.
+
+    Passing the JSON string directly skips the tuple-to-StreamValue
+    conversion that Wagtail performs for python-native content values.
+    """
+    return json.dumps(
+        [{"type": block_type, "value": html, "id": str(uuid.uuid4())}]
+    )
+
+
+@pytest.fixture
+def reusable_block_factory(db):
+    """Factory creating ReusableBlocks without the save() pipeline.
+
+    Rows are inserted via bulk_create with pre-serialized content, so
+    slug generation, clean() and slot detection are all skipped — use
+    ReusableBlock.objects.create where those matter.
+    """
+    counter = itertools.count()
+
+    def make(name=None, html="<p>content</p>", slug=None):
+        n = next(counter)
+        name = name or f"Block {n}"
+        return ReusableBlock.objects.bulk_create(
+            [
+                ReusableBlock(
+                    name=name,
+                    slug=slug or slugify(name),
+                    content=raw_stream_content(html),
+                )
+            ]
+        )[0]
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def global_admin_js_hooks():
+    """Registered insert_global_admin_js hooks, as a set.
+
+    Session-scoped: the registry is fixed after import, and set
+    membership keeps hook-introspection assertions O(1).
+    """
+    from wagtail import hooks
+
+    return set(hooks.get_hooks("insert_global_admin_js"))
+
+
 @pytest.fixture
 def admin_user(db):
     """Create an admin user for testing."""
@@ -1,6 +1,7 @@
 """Integration tests for admin JS config injection via insert_global_admin_js hook."""
 
 import json
+import re
 
 import pytest
 from django.contrib.auth import get_user_model
@@ -32,12 +33,24 @@ def _wagtail_admin_url():
     return reverse("wagtailadmin_home")
 
 
-def _extract_config(html: str) -> dict:
-    """Extract wagtailReusableBlocksConfig JSON from HTML content."""
-    marker = "window.wagtailReusableBlocksConfig="
-    start = html.index(marker) + len(marker)
-    end = html.index(";</script>", start)
-    return json.loads(html[start:end])
+CONFIG_MARKER = b"window.wagtailReusableBlocksConfig="
+
+# All URL-template invariants (route segments, placeholder, suffix) in
+# one precompiled pattern: a single scan instead of chained checks.
+URL_TEMPLATE_RE = re.compile(
+    r"^(/.+)?/reusable-blocks/blocks/__BLOCK_ID__/slots/$"
+)
+
+
+def _extract_config(content: bytes) -> dict:
+    """Extract wagtailReusableBlocksConfig JSON from raw response bytes.
+
+    Operating on bytes skips decoding the whole admin page; json.loads
+    accepts the UTF-8 slice directly.
+    """
+    start = content.index(CONFIG_MARKER) + len(CONFIG_MARKER)
+    end = content.index(b";</script>", start)
+    return json.loads(content[start:end])
 
 
 @pytest.mark.django_db
@@ -62,8 +75,7 @@ class TestSlotUrlConfigInjection:
         response = admin_client.get(_wagtail_admin_url())
 
         assert response.status_code == 200
-        content = response.content.decode("utf-8")
-        assert "window.wagtailReusableBlocksConfig=" in content
+        assert CONFIG_MARKER in response.content
 
     def test_injected_config_contains_valid_slots_url_template(self, admin_client):
         """Injected config script contains a valid slotsUrlTemplate with placeholder.
@@ -83,14 +95,10 @@ class TestSlotUrlConfigInjection:
         4. Assert the URL path includes the expected route segments
         """
         response = admin_client.get(_wagtail_admin_url())
-        content = response.content.decode("utf-8")
-        config = _extract_config(content)
+        config = _extract_config(response.content)
 
         assert "slotsUrlTemplate" in config
-        url_template = config["slotsUrlTemplate"]
-        assert "__BLOCK_ID__" in url_template
-        assert "/reusable-blocks/blocks/" in url_template
-        assert url_template.endswith("/slots/")
+        assert URL_TEMPLATE_RE.match(config["slotsUrlTemplate"])
 
     def test_injected_url_template_resolves_to_working_endpoint(
         self,
@@ -115,8 +123,7 @@ class TestSlotUrlConfigInjection:
         4. Assert 404 (block not found, not URL routing error)
         """
         response = admin_client.get(_wagtail_admin_url())
-        content = response.content.decode("utf-8")
-        config = _extract_config(content)
+        config = _extract_config(response.content)
 
         url = config["slotsUrlTemplate"].replace("__BLOCK_ID__", "99999")
         slots_response = admin_client.get(url)
@@ -141,8 +148,7 @@ class TestSlotUrlConfigInjection:
         4. Assert both URLs match
         """
         response = admin_client.get(_wagtail_admin_url())
-        content = response.content.decode("utf-8")
-        config = _extract_config(content)
+        config = _extract_config(response.content)
 
         block_id = 42
         url_from_template = config["slotsUrlTemplate"].replace(
@@ -194,7 +200,6 @@ class TestSlotUrlConfigInjection:
         response = admin_client.get(_wagtail_admin_url())
 
         assert response.status_code == 200
-        content = response.content.decode("utf-8")
-        config = _extract_config(content)
+        config = _extract_config(response.content)
 
         assert "__BLOCK_ID__" in config["slotsUrlTemplate"]
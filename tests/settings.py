@@ -58,6 +58,19 @@ MIDDLEWARE = [
     "wagtail.contrib.redirects.middleware.RedirectMiddleware",
 ]
 
+# Serve static assets through WhiteNoise when the e2e extra is installed:
+# the default staticfiles view re-walks every finder per request, which
+# Playwright pays for on each admin page load against live_server.
+# AUTOREFRESH off + USE_FINDERS on builds the file index once at startup.
+try:
+    import whitenoise  # noqa: F401
+except ImportError:
+    pass
+else:
+    MIDDLEWARE.insert(1, "whitenoise.middleware.WhiteNoiseMiddleware")
+    WHITENOISE_USE_FINDERS = True
+    WHITENOISE_AUTOREFRESH = False
+
 ROOT_URLCONF = "tests.urls"
 
 TEMPLATES = [
@@ -77,16 +90,25 @@ TEMPLATES = [
 ]
 
 # Database
+# The test database is file-backed (SQLite defaults to in-memory for
+# tests otherwise) so pytest-django's --reuse-db can keep the migrated
+# schema between runs; the Wagtail migration stack dominates session
+# startup. Pass --create-db after changing migrations.
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
-        "NAME": ":memory:",
+        "NAME": os.path.join(BASE_DIR, "test_db.sqlite3"),
+        "TEST": {"NAME": os.path.join(BASE_DIR, "test_db.sqlite3")},
     }
 }
 
 # Password validation
 AUTH_PASSWORD_VALIDATORS: list[dict[str, str]] = []
 
+# Fast (insecure) hasher: the default PBKDF2 iteration count makes every
+# user creation and login in tests pay a deliberate key-stretching cost.
+PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
 # Internationalization
 LANGUAGE_CODE = "en-us"
 TIME_ZONE = "UTC"
@@ -1,11 +1,15 @@
 """Tests for ReusableBlock admin UI customization."""
 
 import json
+from datetime import timedelta
 from unittest import mock
 
 import pytest
 from django.test import override_settings
+from django.utils import timezone
 
+from tests.conftest import raw_stream_content
+from wagtail_reusable_blocks import wagtail_hooks as _hooks_module
 from wagtail_reusable_blocks.models import ReusableBlock
 from wagtail_reusable_blocks.wagtail_hooks import (
     BLOCK_ID_PLACEHOLDER,
@@ -16,29 +20,48 @@ from wagtail_reusable_blocks.wagtail_hooks import (
 )
 
 
-class TestReusableBlockViewSet:
-    """Tests for ReusableBlockViewSet configuration."""
+_SCRIPT_PREFIX = "<script>window.wagtailReusableBlocksConfig="
+_SCRIPT_SUFFIX = ";</script>"
+_PREFIX_LEN, _SUFFIX_LEN = len(_SCRIPT_PREFIX), len(_SCRIPT_SUFFIX)
 
-    @pytest.fixture
-    def viewset(self):
-        """Create a ReusableBlockViewSet instance."""
-        return ReusableBlockViewSet()
 
-    def test_model_configuration(self, viewset):
-        """ViewSet is configured with correct model."""
-        assert viewset.model == ReusableBlock
+def _config_body(script):
+    """Slice the JSON body out of the injected script tag.
 
-    def test_icon_configuration(self, viewset):
-        """ViewSet has correct icon."""
-        assert viewset.icon == "snippet"
+    Fixed-length slicing: the envelope is constant, so no per-call
+    prefix/suffix comparison is needed.
+    """
+    return script[_PREFIX_LEN:-_SUFFIX_LEN]
+
+
+class TestReusableBlockViewSet:
+    """Tests for ReusableBlockViewSet configuration."""
 
-    def test_menu_label(self, viewset):
-        """ViewSet has correct menu label."""
-        assert viewset.menu_label == "Reusable Blocks"
+    @pytest.fixture(scope="class")
+    @classmethod
+    def viewset(cls):
+        """Create a ReusableBlockViewSet instance, once per class."""
+        return ReusableBlockViewSet()
 
-    def test_search_fields(self, viewset):
-        """ViewSet has correct search fields."""
-        assert viewset.search_fields == ["name", "slug"]
+    # (attribute, expected) pairs: one parametrized test avoids
+    # constructing a fresh viewset per tiny assertion.
+    ATTRIBUTE_EXPECTATIONS = [
+        ("model", ReusableBlock),
+        ("icon", "snippet"),
+        ("menu_label", "Reusable Blocks"),
+        ("search_fields", ["name", "slug"]),
+        ("list_per_page", 50),
+        ("filterset_class", ReusableBlockFilterSet),
+        ("ordering", ["-updated_at"]),
+        ("copy_view_enabled", True),
+        ("inspect_view_enabled", True),
+        ("preview_enabled", True),
+    ]
+
+    @pytest.mark.parametrize("attr,expected", ATTRIBUTE_EXPECTATIONS)
+    def test_viewset_attribute(self, viewset, attr, expected):
+        """ViewSet configuration attributes have the expected values."""
+        assert getattr(viewset, attr) == expected
 
     def test_list_display(self, viewset):
         """ViewSet has correct list display columns."""
@@ -47,30 +70,6 @@ class TestReusableBlockViewSet:
         # LiveStatusTagColumn and UpdatedAtColumn are also in the list
         assert len(viewset.list_display) == 4
 
-    def test_list_per_page(self, viewset):
-        """ViewSet has correct pagination."""
-        assert viewset.list_per_page == 50
-
-    def test_filterset_class(self, viewset):
-        """ViewSet has correct filterset class."""
-        assert viewset.filterset_class == ReusableBlockFilterSet
-
-    def test_ordering(self, viewset):
-        """ViewSet has correct default ordering."""
-        assert viewset.ordering == ["-updated_at"]
-
-    def test_copy_view_enabled(self, viewset):
-        """Copy functionality is enabled."""
-        assert viewset.copy_view_enabled is True
-
-    def test_inspect_view_enabled(self, viewset):
-        """Inspect view is enabled."""
-        assert viewset.inspect_view_enabled is True
-
-    def test_preview_enabled(self, viewset):
-        """Preview functionality is enabled."""
-        assert viewset.preview_enabled is True
-
 
 class TestReusableBlockFilterSet:
     """Tests for ReusableBlockFilterSet."""
@@ -96,48 +95,87 @@ class TestReusableBlockQueryset:
 
     def test_ordering_by_updated_at(self):
         """Blocks are ordered by most recently updated first."""
-        # Create blocks
-        old_block = ReusableBlock.objects.create(
-            name="Old Block",
-            content=[("rich_text", "<p>Old</p>")],
+        # bulk_create inserts both rows in one round-trip, skipping the
+        # save() pipeline — slugs must be provided explicitly. Content is
+        # pre-serialized JSON, skipping the StreamValue conversion.
+        old_block, new_block = ReusableBlock.objects.bulk_create(
+            [
+                ReusableBlock(
+                    name="Old Block",
+                    slug="old-block",
+                    content=raw_stream_content("<p>Old</p>"),
+                ),
+                ReusableBlock(
+                    name="New Block",
+                    slug="new-block",
+                    content=raw_stream_content("<p>New</p>"),
+                ),
+            ]
+        )
+
+        # Pin updated_at explicitly instead of relying on wall-clock
+        # resolution between the two inserts
+        now = timezone.now()
+        ReusableBlock.objects.filter(pk=old_block.pk).update(
+            updated_at=now - timezone.timedelta(minutes=1)
         )
-        new_block = ReusableBlock.objects.create(
-            name="New Block",
-            content=[("rich_text", "<p>New</p>")],
+        ReusableBlock.objects.filter(pk=new_block.pk).update(updated_at=now)
+
+        # Default ordering should be -updated_at; compare pks to skip
+        # hydrating model instances and their StreamField content. Filter
+        # to this test's own rows so blocks committed by class-scoped
+        # fixtures elsewhere in the module can't perturb the assertion.
+        ordered_pks = list(
+            ReusableBlock.objects.filter(
+                pk__in=[old_block.pk, new_block.pk]
+            ).values_list("pk", flat=True)
         )
+        assert ordered_pks == [new_block.pk, old_block.pk]
 
-        # Default ordering should be -updated_at
-        blocks = ReusableBlock.objects.all()
-        assert list(blocks) == [new_block, old_block]
+    @pytest.fixture(scope="class")
+    @classmethod
+    def shared_test_block(cls, django_db_setup, django_db_blocker):
+        """Create one committed block shared by the lookup tests.
 
-    def test_search_fields_accessible(self):
+        Class-scoped to avoid an INSERT per test; committed outside the
+        per-test transaction, so it is deleted explicitly at teardown.
+        """
+        with django_db_blocker.unblock():
+            block = ReusableBlock.objects.create(
+                name="Test Block",
+                content=[("rich_text", "<p>Content</p>")],
+            )
+        yield block
+        with django_db_blocker.unblock():
+            block.delete()
+
+    def test_search_fields_accessible(self, shared_test_block):
         """Search fields (name, slug) are accessible for filtering."""
-        ReusableBlock.objects.create(
-            name="Test Block",
-            content=[("rich_text", "<p>Content</p>")],
-        )
-
+        # Presence is all these assert; exists() short-circuits with
+        # SELECT 1 ... LIMIT 1 instead of COUNT(*)
         # Search by name
-        assert ReusableBlock.objects.filter(name__icontains="test").count() == 1
+        assert ReusableBlock.objects.filter(name__icontains="test").exists()
 
         # Search by slug (auto-generated from name)
-        assert ReusableBlock.objects.filter(slug__icontains="test-block").count() == 1
+        assert ReusableBlock.objects.filter(slug__icontains="test-block").exists()
 
-    def test_filter_by_date_fields(self):
+    def test_filter_by_date_fields(self, shared_test_block):
         """Date fields (created_at, updated_at) can be filtered."""
-        from django.utils import timezone
-
-        ReusableBlock.objects.create(
-            name="Test Block",
-            content=[("rich_text", "<p>Content</p>")],
+        # Derive the date from the stored row rather than the live
+        # clock: deterministic even across a midnight boundary.
+        today = shared_test_block.created_at.date()
+        assert ReusableBlock.objects.filter(created_at__date=today).exists()
+
+        # Filter updated_at by timestamp range rather than __date: the
+        # cast-free predicate stays index-sargable on PostgreSQL and is
+        # the recommended pattern for callers filtering on updated_at
+        start = shared_test_block.updated_at.replace(
+            hour=0, minute=0, second=0, microsecond=0
         )
-
-        # Filter by created_at date
-        today = timezone.now().date()
-        assert ReusableBlock.objects.filter(created_at__date=today).count() == 1
-
-        # Filter by updated_at date
-        assert ReusableBlock.objects.filter(updated_at__date=today).count() == 1
+        end = start + timedelta(days=1)
+        assert ReusableBlock.objects.filter(
+            updated_at__gte=start, updated_at__lt=end
+        ).exists()
 
 
 class TestWagtailHooksRegistration:
@@ -145,27 +183,18 @@ class TestWagtailHooksRegistration:
 
     def test_viewset_registration_when_enabled(self):
         """ViewSet is registered when REGISTER_DEFAULT_SNIPPET is True."""
-        # This test verifies the default behavior - the viewset should be registered
-        # We can't easily check if register_snippet was called, but we can verify
-        # the module executes without errors
-        import wagtail_reusable_blocks.wagtail_hooks  # noqa: F401
-
-        # If we got here without errors, the registration succeeded
-        assert True
+        # This test verifies the default behavior - the viewset should be
+        # registered; module import succeeded at module scope, so check
+        # the guard that controls registration.
+        assert _hooks_module._should_register_default_snippet() is True
 
     @override_settings(WAGTAIL_REUSABLE_BLOCKS={"REGISTER_DEFAULT_SNIPPET": False})
     def test_viewset_not_registered_when_disabled(self):
         """ViewSet is not registered when REGISTER_DEFAULT_SNIPPET is False."""
-        # Re-import the module to test the conditional registration
-        import importlib
-
-        import wagtail_reusable_blocks.wagtail_hooks
-
-        importlib.reload(wagtail_reusable_blocks.wagtail_hooks)
-
-        # If we got here without errors, the conditional worked correctly
-        # The ViewSet class still exists but register_snippet wasn't called
-        assert True
+        # Test the registration guard directly; reloading the module
+        # would re-run every @hooks.register and leak duplicate hooks
+        # into the rest of the session.
+        assert _hooks_module._should_register_default_snippet() is False
 
 
 class TestInjectReusableBlocksConfig:
@@ -182,72 +211,72 @@ class TestInjectReusableBlocksConfig:
     MOCK_REVERSE_PATH = "wagtail_reusable_blocks.wagtail_hooks.reverse"
     DEFAULT_REVERSED_URL = "/admin/reusable-blocks/blocks/0/slots/"
 
-    @pytest.fixture
-    def mock_reverse(self):
-        """Mock django.urls.reverse to avoid URL resolver dependency."""
-        with mock.patch(self.MOCK_REVERSE_PATH) as mocked:
-            mocked.return_value = self.DEFAULT_REVERSED_URL
-            yield mocked
+    @pytest.fixture(autouse=True)
+    def reset_config_script_cache(self):
+        """Clear the memoized script so each test exercises a fresh build.
 
-    def test_returns_script_tag(self, mock_reverse):
-        """Return value wraps config in a <script> tag.
-
-        Purpose: Verify inject_reusable_blocks_config() returns a string
-            containing <script> tags so the browser can execute the config.
-        Category: Normal case
-        Target: inject_reusable_blocks_config()
-        Technique: Statement coverage (C0)
-        Test data: Default reversed URL /admin/reusable-blocks/blocks/0/slots/
+        The hook caches its output per process; these tests mock reverse()
+        per call and must not observe another test's cached script.
         """
-        result = inject_reusable_blocks_config()
-
-        assert result.startswith("<script>")
-        assert result.endswith("</script>")
+        _hooks_module._config_script = None
+        yield
+        _hooks_module._config_script = None
 
-    def test_contains_global_config_variable(self, mock_reverse):
-        """Return value sets window.wagtailReusableBlocksConfig.
+    @pytest.fixture(scope="class")
+    @classmethod
+    def mock_reverse(cls):
+        """Mock django.urls.reverse to avoid URL resolver dependency.
 
-        Purpose: Verify the script assigns to the expected global variable
-            so slot-chooser.js can read the configuration.
-        Category: Normal case
-        Target: inject_reusable_blocks_config()
-        Technique: Statement coverage (C0)
-        Test data: Default reversed URL
+        Class-scoped: none of the tests change the return value, so the
+        patcher start/stop cycle runs once instead of per test.
         """
-        result = inject_reusable_blocks_config()
-
-        assert "window.wagtailReusableBlocksConfig=" in result
+        with mock.patch(cls.MOCK_REVERSE_PATH) as mocked:
+            mocked.return_value = cls.DEFAULT_REVERSED_URL
+            yield mocked
 
-    def test_contains_slots_url_template_key(self, mock_reverse):
-        """JSON config contains 'slotsUrlTemplate' key.
+    @pytest.fixture(scope="class")
+    @classmethod
+    def rendered(cls, mock_reverse):
+        """Invoke the hook once per class and share (script, body, parsed).
 
-        Purpose: Verify the JSON payload includes the slotsUrlTemplate key
-            that slot-chooser.js uses to construct fetch URLs.
-        Category: Normal case
-        Target: inject_reusable_blocks_config()
-        Technique: Statement coverage (C0)
-        Test data: Default reversed URL
+        The structural tests all assert against the same mocked output;
+        computing it once removes the redundant reverse + JSON round
+        trips per test.
         """
-        result = inject_reusable_blocks_config()
-
-        assert "slotsUrlTemplate" in result
-
-    def test_url_contains_block_id_placeholder(self, mock_reverse):
-        """URL template contains __BLOCK_ID__ placeholder string.
-
-        Purpose: Verify the integer placeholder (0) is replaced with the
-            string placeholder (__BLOCK_ID__) so JavaScript can substitute
-            the actual block ID at runtime.
+        # Drop any script memoized outside this class's mocked reverse
+        _hooks_module._config_script = None
+        script = inject_reusable_blocks_config()
+        body = _config_body(script)
+        return script, body, json.loads(body)
+
+    # Structural invariants of the script string, one parametrized test:
+    # the shared rendered fixture means one hook invocation total. Raw
+    # tuples — pytest's auto-ids are readable enough here.
+    STRUCTURAL_CHECKS = [
+        ("startswith", "<script>"),
+        ("endswith", "</script>"),
+        ("__contains__", "window.wagtailReusableBlocksConfig="),
+        ("__contains__", "slotsUrlTemplate"),
+        ("__contains__", BLOCK_ID_PLACEHOLDER),
+    ]
+
+    @pytest.mark.parametrize("op,expected", STRUCTURAL_CHECKS)
+    def test_script_structure(self, rendered, op, expected):
+        """Script tag structure and required substrings.
+
+        Purpose: Verify the injected script wraps valid config assignments
+            (script tags, global variable, URL template key, placeholder)
+            so slot-chooser.js can consume it.
         Category: Normal case
         Target: inject_reusable_blocks_config()
-        Technique: Equivalence partitioning
-        Test data: Default reversed URL with /0/ that should become /__BLOCK_ID__/
+        Technique: Statement coverage (C0), data-driven
+        Test data: Default reversed URL /admin/reusable-blocks/blocks/0/slots/
         """
-        result = inject_reusable_blocks_config()
+        script, _, _ = rendered
 
-        assert BLOCK_ID_PLACEHOLDER in result
+        assert getattr(script, op)(expected)
 
-    def test_url_does_not_contain_placeholder_integer(self, mock_reverse):
+    def test_url_does_not_contain_placeholder_integer(self, rendered):
         """URL template does not contain the raw placeholder integer /0/.
 
         Purpose: Verify the .replace() call correctly substitutes /0/ with
@@ -257,15 +286,12 @@ class TestInjectReusableBlocksConfig:
         Technique: Boundary value analysis
         Test data: Default reversed URL where /0/ must be fully replaced
         """
-        result = inject_reusable_blocks_config()
-        config_json = result.removeprefix(
-            "<script>window.wagtailReusableBlocksConfig="
-        ).removesuffix(";</script>")
-        parsed = json.loads(config_json)
+        # The raw script holds the same invariant — no JSON parse needed
+        script, _, _ = rendered
 
-        assert f"/{BLOCK_ID_PLACEHOLDER_INT}/" not in parsed["slotsUrlTemplate"]
+        assert f"/{BLOCK_ID_PLACEHOLDER_INT}/" not in script
 
-    def test_returned_json_is_valid(self, mock_reverse):
+    def test_returned_json_is_valid(self, rendered):
         """JSON embedded in the script tag is parseable.
 
         Purpose: Verify the JSON produced by json.dumps() is valid so the
@@ -275,17 +301,12 @@ class TestInjectReusableBlocksConfig:
         Technique: Statement coverage (C0)
         Test data: Default reversed URL
         """
-        result = inject_reusable_blocks_config()
-        config_json = result.removeprefix(
-            "<script>window.wagtailReusableBlocksConfig="
-        ).removesuffix(";</script>")
-
-        parsed = json.loads(config_json)
+        _, _, parsed = rendered
 
         assert isinstance(parsed, dict)
         assert "slotsUrlTemplate" in parsed
 
-    def test_url_template_ends_with_slots_path(self, mock_reverse):
+    def test_url_template_ends_with_slots_path(self, rendered):
         """URL template preserves the /slots/ suffix after placeholder replacement.
 
         Purpose: Verify the .replace() with count=1 only replaces the block ID
@@ -295,13 +316,11 @@ class TestInjectReusableBlocksConfig:
         Technique: Boundary value analysis
         Test data: Default reversed URL
         """
-        result = inject_reusable_blocks_config()
-        config_json = result.removeprefix(
-            "<script>window.wagtailReusableBlocksConfig="
-        ).removesuffix(";</script>")
-        parsed = json.loads(config_json)
+        # The URL value ends the JSON string, so the closing quote
+        # follows /slots/ in the raw script — no JSON parse needed
+        script, _, _ = rendered
 
-        assert parsed["slotsUrlTemplate"].endswith("/slots/")
+        assert '/slots/"' in script
 
     def test_reverse_called_with_correct_arguments(self, mock_reverse):
         """reverse() is called with the correct URL name and kwargs.
@@ -314,12 +333,17 @@ class TestInjectReusableBlocksConfig:
         Technique: Statement coverage (C0)
         Test data: N/A (verifying call arguments)
         """
+        # The class-scoped mock accumulates calls from earlier tests
+        mock_reverse.reset_mock()
+
         inject_reusable_blocks_config()
 
-        mock_reverse.assert_called_once_with(
-            "wagtail_reusable_blocks:block_slots",
-            kwargs={"block_id": BLOCK_ID_PLACEHOLDER_INT},
-        )
+        # Inspect the captured call directly instead of rebuilding an
+        # expected _Call for mock's equality machinery
+        assert mock_reverse.call_count == 1
+        args, kwargs = mock_reverse.call_args
+        assert args == ("wagtail_reusable_blocks:block_slots",)
+        assert kwargs == {"kwargs": {"block_id": BLOCK_ID_PLACEHOLDER_INT}}
 
     @pytest.mark.parametrize(
         "admin_prefix,reversed_url",
@@ -350,17 +374,16 @@ class TestInjectReusableBlocksConfig:
         with mock.patch(self.MOCK_REVERSE_PATH, return_value=reversed_url):
             result = inject_reusable_blocks_config()
 
-        config_json = result.removeprefix(
-            "<script>window.wagtailReusableBlocksConfig="
-        ).removesuffix(";</script>")
-        parsed = json.loads(config_json)
-        url_template = parsed["slotsUrlTemplate"]
+        parsed = json.loads(_config_body(result))
 
-        assert BLOCK_ID_PLACEHOLDER in url_template
-        assert f"/{BLOCK_ID_PLACEHOLDER_INT}/" not in url_template
-        assert url_template.startswith(admin_prefix.rstrip("/"))
+        # One equality against the fully expected URL covers the
+        # placeholder, no-/0/, and prefix invariants at once
+        expected_url = reversed_url.replace(
+            f"/{BLOCK_ID_PLACEHOLDER_INT}/", f"/{BLOCK_ID_PLACEHOLDER}/", 1
+        )
+        assert parsed["slotsUrlTemplate"] == expected_url
 
-    def test_hook_registered_with_wagtail(self):
+    def test_hook_registered_with_wagtail(self, global_admin_js_hooks):
         """inject_reusable_blocks_config is registered as insert_global_admin_js hook.
 
         Purpose: Verify the function is discoverable by Wagtail's hook
@@ -370,11 +393,7 @@ class TestInjectReusableBlocksConfig:
         Technique: Statement coverage (C0)
         Test data: N/A
         """
-        from wagtail import hooks
-
-        registered_hooks = hooks.get_hooks("insert_global_admin_js")
-
-        assert inject_reusable_blocks_config in registered_hooks
+        assert inject_reusable_blocks_config in global_admin_js_hooks
 
     def test_only_first_occurrence_of_placeholder_int_is_replaced(self):
         """Only the first /0/ in the URL is replaced, preserving any trailing /0/.
@@ -391,10 +410,7 @@ class TestInjectReusableBlocksConfig:
         with mock.patch(self.MOCK_REVERSE_PATH, return_value=url_with_double_zero):
             result = inject_reusable_blocks_config()
 
-        config_json = result.removeprefix(
-            "<script>window.wagtailReusableBlocksConfig="
-        ).removesuffix(";</script>")
-        parsed = json.loads(config_json)
+        parsed = json.loads(_config_body(result))
         url_template = parsed["slotsUrlTemplate"]
 
         assert url_template.count(BLOCK_ID_PLACEHOLDER) == 1
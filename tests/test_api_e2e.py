@@ -12,12 +12,37 @@ playwright_sync_api = pytest.importorskip(
 Page = playwright_sync_api.Page
 expect = playwright_sync_api.expect
 
+import json  # noqa: E402
+import uuid  # noqa: E402
+
 import requests  # noqa: E402
+from django.contrib.auth import get_user_model  # noqa: E402
+from requests.adapters import HTTPAdapter  # noqa: E402
+
+from wagtail_reusable_blocks.models import ReusableBlock  # noqa: E402
+
+User = get_user_model()
+
+# Keep E2E tests on their own xdist worker (separate from the contract
+# group) so they share one live_server, login session and browser.
+pytestmark = pytest.mark.xdist_group(name="e2e")
+
+
+def _raw_content(block_type: str, value: str) -> str:
+    """Pre-serialized single-block StreamField payload."""
+    return json.dumps([{"type": block_type, "value": value, "id": str(uuid.uuid4())}])
 
 
 @pytest.fixture
 def authenticated_page(page: Page, live_server, admin_user) -> Page:
-    """Login to Wagtail admin and return authenticated page."""
+    """Login to Wagtail admin and return authenticated page.
+
+    The login is deliberately per-test: these tests run with
+    transaction=True, whose teardown flushes every table — including
+    django_session and the admin user — so a session-scoped cookie
+    (e.g. via Playwright storage_state) would be dead after the first
+    test.
+    """
     page.goto(f"{live_server.url}/login/")
     page.locator("#id_username").fill("admin")
     page.locator("#id_password").fill("password")
@@ -26,23 +51,76 @@ def authenticated_page(page: Page, live_server, admin_user) -> Page:
     return page
 
 
-@pytest.fixture
-def api_session(live_server, admin_user) -> requests.Session:
-    """Authenticated requests.Session for DRF API calls against live_server."""
+@pytest.fixture(scope="session")
+def api_session(live_server, django_db_blocker) -> requests.Session:
+    """Authenticated requests.Session for DRF API calls against live_server.
+
+    Session-scoped like live_server itself: the login round-trips run
+    once and every API call reuses the same kept-alive TCP connections.
+    The admin user is committed via django_db_blocker so it outlives
+    per-test transactions; get-or-create tolerates a leaked row.
+    """
+    with django_db_blocker.unblock():
+        user = User.objects.filter(username="e2e_api_admin").first()
+        if user is None:
+            user = User.objects.create_superuser(
+                username="e2e_api_admin",
+                email="e2e_api_admin@example.com",
+                password="password",
+            )
     session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
     login_url = f"{live_server.url}/login/"
     resp = session.get(login_url)
     csrftoken = resp.cookies.get("csrftoken", "")
     session.post(
         login_url,
         data={
-            "username": "admin",
+            "username": "e2e_api_admin",
             "password": "password",
             "csrfmiddlewaretoken": csrftoken,
         },
         headers={"Referer": login_url},
     )
-    return session
+    yield session
+    session.close()
+    with django_db_blocker.unblock():
+        User.objects.filter(username="e2e_api_admin").delete()
+
+
+@pytest.fixture(scope="session")
+def preview_blocks(django_db_blocker) -> dict[str, ReusableBlock]:
+    """rich_text and raw_html blocks seeded directly via the ORM.
+
+    The preview tests exercise admin rendering, not API creation (the
+    contract suite covers that), so seeding skips the HTTP/CSRF/serializer
+    round-trips. Rows are committed outside test transactions and removed
+    on teardown.
+    """
+    with django_db_blocker.unblock():
+        rich, raw = ReusableBlock.objects.bulk_create(
+            [
+                ReusableBlock(
+                    name="E2E Rich Text Block",
+                    slug="e2e-rich-text",
+                    content=_raw_content("rich_text", "<p>Hello from the API</p>"),
+                ),
+                ReusableBlock(
+                    name="E2E Raw HTML Block",
+                    slug="e2e-raw-html",
+                    content=_raw_content(
+                        "raw_html",
+                        '<div class="hero-banner">'
+                        "<h1>Welcome</h1>"
+                        "<p>Custom HTML content</p>"
+                        "</div>",
+                    ),
+                ),
+            ]
+        )
+    yield {"rich": rich, "raw": raw}
+    with django_db_blocker.unblock():
+        ReusableBlock.objects.filter(pk__in=[rich.pk, raw.pk]).delete()
 
 
 def _create_block_via_api(
@@ -71,33 +149,31 @@ def _create_block_via_api(
 
 @pytest.mark.e2e
 @pytest.mark.django_db(transaction=True)
-def test_api_created_blocks_render_in_admin(
+def test_blocks_render_in_admin(
     authenticated_page: Page,
-    api_session: requests.Session,
+    preview_blocks: dict,
     live_server,
 ):
-    """API-created rich_text and raw_html blocks render correctly in admin preview.
+    """rich_text and raw_html blocks render correctly in admin preview.
 
-    Purpose: Verify that ReusableBlocks created via the DRF API (rich_text
-             and raw_html) appear in the Wagtail admin snippet listing and
-             render correctly in the edit view preview, ensuring the end-to-end
-             headless CMS use case.
+    Purpose: Verify that ReusableBlocks (rich_text and raw_html) appear in
+             the Wagtail admin snippet listing and render correctly in the
+             edit view preview, ensuring the end-to-end headless CMS use case.
+             Blocks are seeded via the ORM; HTTP creation is covered by
+             test_api_created_block_appears_in_listing and the contract suite.
     Type: Normal
     Technique: Critical path, user journey
-    User flow: API creation -> Admin login -> Listing check -> Edit view preview
+    User flow: Admin login -> Listing check -> Edit view preview
     Prerequisites:
     - Django live_server is running
-    - DRF CRUD endpoint is available at /api/reusable-blocks/
     Test data:
-    - ReusableBlock with rich_text (created via API)
-    - ReusableBlock with raw_html (created via API)
+    - ReusableBlock with rich_text (seeded via ORM)
+    - ReusableBlock with raw_html (seeded via ORM)
     Steps:
-    1. Create a rich_text block via DRF API
-    2. Create a raw_html block via DRF API
-    3. Navigate to the snippet listing page while logged in to Wagtail admin
-    4. Verify both blocks appear in the listing
-    5. Open the rich_text block edit page and check the preview content
-    6. Open the raw_html block edit page and check the preview content
+    1. Navigate to the snippet listing page while logged in to Wagtail admin
+    2. Verify both blocks appear in the listing
+    3. Open the rich_text block edit page and check the preview content
+    4. Open the raw_html block edit page and check the preview content
     Expected results:
     - Both blocks appear in the listing
     - rich_text preview shows the paragraph text
@@ -105,48 +181,16 @@ def test_api_created_blocks_render_in_admin(
     """
     page = authenticated_page
     base_url = live_server.url
+    rich_block_id = preview_blocks["rich"].pk
+    raw_block_id = preview_blocks["raw"].pk
 
-    # --- Step 1: Create rich_text block via API ---
-    rich_block = _create_block_via_api(
-        api_session,
-        base_url,
-        name="E2E Rich Text Block",
-        slug="e2e-rich-text",
-        content=[
-            {
-                "type": "rich_text",
-                "value": "<p>Hello from the API</p>",
-            }
-        ],
-    )
-    rich_block_id = rich_block["id"]
-
-    # --- Step 2: Create raw_html block via API ---
-    raw_block = _create_block_via_api(
-        api_session,
-        base_url,
-        name="E2E Raw HTML Block",
-        slug="e2e-raw-html",
-        content=[
-            {
-                "type": "raw_html",
-                "value": (
-                    '<div class="hero-banner">'
-                    "<h1>Welcome</h1>"
-                    "<p>Custom HTML content</p>"
-                    "</div>"
-                ),
-            }
-        ],
-    )
-    raw_block_id = raw_block["id"]
-
-    # --- Step 3: Navigate to snippet listing ---
+    # --- Step 1: Navigate to snippet listing ---
     listing_url = f"{base_url}/snippets/wagtail_reusable_blocks/reusableblock/"
     page.goto(listing_url)
-    page.wait_for_load_state("networkidle")
 
-    # --- Step 4: Both blocks appear in the listing ---
+    # --- Step 2: Both blocks appear in the listing ---
+    # No networkidle waits below: expect() auto-waits for the exact
+    # element, while networkidle burns ~500ms of forced idle per call.
     expect(page.get_by_role("link", name="E2E Rich Text Block")).to_be_visible(
         timeout=10000
     )
@@ -154,13 +198,12 @@ def test_api_created_blocks_render_in_admin(
         timeout=10000
     )
 
-    # --- Step 5: Open rich_text block edit and check preview ---
+    # --- Step 3: Open rich_text block edit and check preview ---
     edit_url = (
         f"{base_url}/snippets/wagtail_reusable_blocks/"
         f"reusableblock/edit/{rich_block_id}/"
     )
     page.goto(edit_url)
-    page.wait_for_load_state("networkidle")
 
     preview_button = page.locator(
         "button:has-text('Preview'), [data-side-panel-toggle='preview']"
@@ -173,13 +216,12 @@ def test_api_created_blocks_render_in_admin(
         "Hello from the API", timeout=15000
     )
 
-    # --- Step 6: Open raw_html block edit and check preview ---
+    # --- Step 4: Open raw_html block edit and check preview ---
     edit_url = (
         f"{base_url}/snippets/wagtail_reusable_blocks/"
         f"reusableblock/edit/{raw_block_id}/"
     )
     page.goto(edit_url)
-    page.wait_for_load_state("networkidle")
 
     preview_button = page.locator(
         "button:has-text('Preview'), [data-side-panel-toggle='preview']"
@@ -192,3 +234,47 @@ def test_api_created_blocks_render_in_admin(
     expect(preview_frame.locator("body")).to_contain_text(
         "Custom HTML content", timeout=15000
     )
+
+
+@pytest.mark.e2e
+@pytest.mark.django_db(transaction=True)
+def test_api_created_block_appears_in_listing(
+    authenticated_page: Page,
+    api_session: requests.Session,
+    live_server,
+):
+    """Block created over HTTP via the DRF API appears in the admin listing.
+
+    Purpose: Keep one end-to-end check of the HTTP creation path (CSRF,
+             session auth, serializer) now that the preview tests seed
+             their data via the ORM.
+    Type: Normal
+    Technique: Critical path
+    User flow: API creation -> Admin listing check
+    Prerequisites:
+    - Django live_server is running
+    - DRF CRUD endpoint is available at /api/reusable-blocks/
+    Test data:
+    - ReusableBlock with rich_text (created via API)
+    Steps:
+    1. Create a rich_text block via DRF API
+    2. Navigate to the snippet listing page while logged in to Wagtail admin
+    3. Verify the block appears in the listing
+    Expected results:
+    - API returns 201 and the block is visible in the listing
+    """
+    page = authenticated_page
+    base_url = live_server.url
+
+    _create_block_via_api(
+        api_session,
+        base_url,
+        name="E2E API Created Block",
+        slug="e2e-api-created",
+        content=[{"type": "rich_text", "value": "<p>Created over HTTP</p>"}],
+    )
+
+    page.goto(f"{base_url}/snippets/wagtail_reusable_blocks/reusableblock/")
+    expect(page.get_by_role("link", name="E2E API Created Block")).to_be_visible(
+        timeout=10000
+    )
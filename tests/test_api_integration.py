@@ -342,16 +342,16 @@ class TestDRFCreateEndpoint:
         assert response.status_code == 400
 
     @pytest.mark.django_db
-    def test_create_duplicate_name_blocks_returns_slug_error(
+    def test_create_duplicate_name_blocks_appends_slug_suffix(
         self, api_client, admin_user
     ):
-        """Creating two blocks with the same name returns slug duplicate error (400, not IntegrityError).
+        """Creating two blocks with the same name disambiguates the second slug.
 
-        Purpose: Verify that when creating two blocks with the same name,
-                 auto-generated slug duplication returns 400 instead of IntegrityError.
-        Type: Error
+        Purpose: Verify that auto-generated slug duplication is resolved with
+                 a numeric suffix (201) rather than a 400 or IntegrityError.
+        Type: Normal
         Technique: API endpoint
-        Integration: POST /api/reusable-blocks/ -> ReusableBlockSerializer.validate -> 400
+        Integration: POST /api/reusable-blocks/ -> ReusableBlockSerializer.validate -> 201
         Test data:
         - Admin user
         - Existing block with name: "Same Name"
@@ -359,7 +359,7 @@ class TestDRFCreateEndpoint:
         Scenario:
         1. Create a block with name="Same Name" via API
         2. POST to /api/reusable-blocks/ with the same name again
-        3. Verify response is 400 (not IntegrityError)
+        3. Verify the second block is created with slug "same-name-2"
         """
         api_client.force_login(admin_user)
 
@@ -369,13 +369,15 @@ class TestDRFCreateEndpoint:
             content_type="application/json",
         )
         assert response1.status_code == 201
+        assert response1.json()["slug"] == "same-name"
 
         response2 = api_client.post(
             "/api/reusable-blocks/",
             data={"name": "Same Name", "content": []},
             content_type="application/json",
         )
-        assert response2.status_code == 400
+        assert response2.status_code == 201
+        assert response2.json()["slug"] == "same-name-2"
 
     @pytest.mark.django_db
     def test_create_block_with_streamfield_json_content(self, api_client, admin_user):
@@ -670,7 +672,7 @@ class TestDRFCircularReferenceValidation:
                  ensuring circular reference protection at the API level.
         Type: Error
         Technique: API endpoint
-        Integration: PUT /api/reusable-blocks/<id>/ -> ReusableBlockSerializer -> full_clean -> 400
+        Integration: PUT /api/reusable-blocks/<id>/ -> ReusableBlockSerializer -> unique constraint -> 400
         Test data:
         - Admin user
         - Existing block that attempts self-reference
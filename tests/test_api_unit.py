@@ -24,9 +24,12 @@
 | DT5 | []                     | []                     |
 """
 
+import json
 from unittest import mock
 
 import pytest
+from django.db import IntegrityError
+from django.test import override_settings
 from django.utils.text import slugify
 from rest_framework import permissions, serializers, status
 
@@ -77,10 +80,7 @@ class TestGetSetting:
 
         assert result is None
 
-    @mock.patch(
-        "wagtail_reusable_blocks.conf.settings",
-    )
-    def test_user_setting_overrides_default(self, mock_settings):
+    def test_user_setting_overrides_default(self):
         """Verify that user settings override default values.
 
         Purpose: Verify that providing WAGTAIL_REUSABLE_BLOCKS with custom
@@ -91,18 +91,14 @@ class TestGetSetting:
         Test data: Override to AllowAny permission
         """
         custom_classes = ["rest_framework.permissions.AllowAny"]
-        mock_settings.WAGTAIL_REUSABLE_BLOCKS = {
-            "API_PERMISSION_CLASSES": custom_classes,
-        }
-
-        result = get_setting("API_PERMISSION_CLASSES")
+        with override_settings(
+            WAGTAIL_REUSABLE_BLOCKS={"API_PERMISSION_CLASSES": custom_classes}
+        ):
+            result = get_setting("API_PERMISSION_CLASSES")
 
         assert result == custom_classes
 
-    @mock.patch(
-        "wagtail_reusable_blocks.conf.settings",
-    )
-    def test_user_setting_overrides_none_to_list(self, mock_settings):
+    def test_user_setting_overrides_none_to_list(self):
         """Verify that a None default can be overridden with a list.
 
         Purpose: Verify that API_AUTHENTICATION_CLASSES default None can be
@@ -114,11 +110,10 @@ class TestGetSetting:
         Test data: Override to TokenAuthentication
         """
         custom_auth = ["rest_framework.authentication.TokenAuthentication"]
-        mock_settings.WAGTAIL_REUSABLE_BLOCKS = {
-            "API_AUTHENTICATION_CLASSES": custom_auth,
-        }
-
-        result = get_setting("API_AUTHENTICATION_CLASSES")
+        with override_settings(
+            WAGTAIL_REUSABLE_BLOCKS={"API_AUTHENTICATION_CLASSES": custom_auth}
+        ):
+            result = get_setting("API_AUTHENTICATION_CLASSES")
 
         assert result == custom_auth
 
@@ -331,96 +326,52 @@ class TestReusableBlockSerializerFields:
 
 
 # ---------------------------------------------------------------------------
-# ReusableBlockSerializer - validate_slug
+# ReusableBlockSerializer - explicit slug handling
 # ---------------------------------------------------------------------------
-class TestReusableBlockSerializerValidateSlug:
-    """ReusableBlockSerializer.validate_slug slug uniqueness tests."""
-
-    @mock.patch("wagtail_reusable_blocks.api.serializers.ReusableBlock.objects")
-    def test_unique_slug_passes_validation(self, mock_objects):
-        """Verify that a unique slug passes validation.
-
-        Purpose: Verify that validate_slug accepts a non-duplicate slug,
-                 ensuring unique slug acceptance.
-        Type: Normal
-        Target: ReusableBlockSerializer.validate_slug(value)
-        Technique: Equivalence partitioning
-        Test data: slug "new-block" not in database
-        """
-        mock_qs = mock.MagicMock()
-        mock_qs.exists.return_value = False
-        mock_objects.filter.return_value = mock_qs
-        serializer = ReusableBlockSerializer()
+class TestReusableBlockSerializerExplicitSlug:
+    """ReusableBlockSerializer explicit-slug handling tests.
 
-        result = serializer.validate_slug("new-block")
-
-        assert result == "new-block"
-        mock_objects.filter.assert_called_once_with(slug="new-block")
+    Explicit slugs are validated by the unique=True DB constraint at save
+    time; validate() only queries for auto-generated slugs.
+    """
 
     @mock.patch("wagtail_reusable_blocks.api.serializers.ReusableBlock.objects")
-    def test_duplicate_slug_raises_error_on_create(self, mock_objects):
-        """Verify that a duplicate slug raises ValidationError on create.
+    def test_explicit_slug_skips_existence_query(self, mock_objects):
+        """Verify that an explicit slug does not trigger an existence query.
 
-        Purpose: Verify that validate_slug raises ValidationError for a
-                 duplicate slug, ensuring slug uniqueness constraint.
-        Type: Error
-        Target: ReusableBlockSerializer.validate_slug(value)
-        Technique: Equivalence partitioning
-        Test data: slug "existing-block" already in database
-        """
-        mock_qs = mock.MagicMock()
-        mock_qs.exists.return_value = True
-        mock_objects.filter.return_value = mock_qs
-        serializer = ReusableBlockSerializer()
-
-        with pytest.raises(serializers.ValidationError, match="already exists"):
-            serializer.validate_slug("existing-block")
-
-    @mock.patch("wagtail_reusable_blocks.api.serializers.ReusableBlock.objects")
-    def test_update_excludes_own_pk_from_uniqueness_check(self, mock_objects):
-        """Verify that the own PK is excluded from uniqueness check on update.
-
-        Purpose: Verify that validate_slug excludes the current instance's PK
-                 from the uniqueness check, ensuring self-exclusion on update.
+        Purpose: Verify that validate defers explicit-slug uniqueness to
+                 the DB constraint, avoiding a redundant query per write.
         Type: Normal
-        Target: ReusableBlockSerializer.validate_slug(value)
+        Target: ReusableBlockSerializer.validate(attrs)
         Technique: Equivalence partitioning
-        Test data: Instance with pk=42 retaining its own slug
+        Test data: slug "custom-slug" explicitly provided
         """
-        mock_instance = mock.Mock(pk=42)
-        mock_qs = mock.MagicMock()
-        mock_qs.exclude.return_value = mock_qs
-        mock_qs.exists.return_value = False
-        mock_objects.filter.return_value = mock_qs
         serializer = ReusableBlockSerializer()
-        serializer.instance = mock_instance
+        attrs = {"name": "My Block", "slug": "custom-slug"}
 
-        result = serializer.validate_slug("my-block")
+        result = serializer.validate(attrs)
 
-        assert result == "my-block"
-        mock_qs.exclude.assert_called_once_with(pk=42)
+        assert result["slug"] == "custom-slug"
+        mock_objects.filter.assert_not_called()
 
-    @mock.patch("wagtail_reusable_blocks.api.serializers.ReusableBlock.objects")
-    def test_update_detects_duplicate_slug_from_other_instance(self, mock_objects):
-        """Verify that slug duplication with another instance is detected on update.
+    def test_integrity_error_is_converted_to_validation_error(self):
+        """Verify that a slug IntegrityError on save becomes a 400-style error.
 
-        Purpose: Verify that validate_slug detects slug duplication with
-                 another instance during update, raising ValidationError.
+        Purpose: Verify that _save_instance converts a unique-constraint
+                 IntegrityError (race between check and save) into a DRF
+                 ValidationError keyed on slug.
         Type: Error
-        Target: ReusableBlockSerializer.validate_slug(value)
-        Technique: Equivalence partitioning
-        Test data: Instance with pk=42 attempting to use another instance's slug
+        Target: ReusableBlockSerializer._save_instance(instance)
+        Technique: Error guessing
+        Test data: Mock instance whose save raises IntegrityError
         """
-        mock_instance = mock.Mock(pk=42)
-        mock_qs = mock.MagicMock()
-        mock_qs.exclude.return_value = mock_qs
-        mock_qs.exists.return_value = True
-        mock_objects.filter.return_value = mock_qs
-        serializer = ReusableBlockSerializer()
-        serializer.instance = mock_instance
+        instance = mock.Mock()
+        instance.save.side_effect = IntegrityError("UNIQUE constraint failed")
 
-        with pytest.raises(serializers.ValidationError, match="already exists"):
-            serializer.validate_slug("taken-slug")
+        with pytest.raises(serializers.ValidationError) as exc_info:
+            ReusableBlockSerializer._save_instance(instance)
+
+        assert "slug" in exc_info.value.detail
 
 
 # ---------------------------------------------------------------------------
@@ -495,27 +446,27 @@ class TestReusableBlockSerializerValidate:
         assert result["slug"] == "custom-slug"
 
     @mock.patch("wagtail_reusable_blocks.api.serializers.ReusableBlock.objects")
-    def test_auto_generated_slug_uniqueness_check(self, mock_objects):
-        """Verify that ValidationError is raised when auto-generated slug already exists.
+    def test_auto_generated_slug_collision_appends_suffix(self, mock_objects):
+        """Verify that a colliding auto-generated slug gains a numeric suffix.
 
-        Purpose: Verify that validate raises ValidationError when the auto-generated
-                 slug duplicates an existing one, ensuring auto-generated slug
-                 uniqueness check.
-        Type: Error
+        Purpose: Verify that validate disambiguates an auto-generated slug
+                 that duplicates an existing one instead of erroring,
+                 avoiding a 4xx + retry cycle on concurrent creates.
+        Type: Normal
         Target: ReusableBlockSerializer.validate(attrs)
         Technique: Error guessing
         Test data: Auto-generated slug "my-block" already exists in database
         """
         mock_qs = mock.MagicMock()
-        mock_qs.exists.return_value = True
+        mock_qs.values_list.return_value = ["my-block", "my-block-2"]
         mock_objects.filter.return_value = mock_qs
         serializer = ReusableBlockSerializer()
         attrs = {"name": "My Block"}
 
-        with pytest.raises(serializers.ValidationError) as exc_info:
-            serializer.validate(attrs)
+        result = serializer.validate(attrs)
 
-        assert "slug" in exc_info.value.detail
+        assert result["slug"] == "my-block-3"
+        mock_objects.filter.assert_called_once_with(slug__startswith="my-block")
 
     @mock.patch("wagtail_reusable_blocks.api.serializers.ReusableBlock.objects")
     def test_auto_generated_slug_excludes_self_on_update(self, mock_objects):
@@ -571,8 +522,8 @@ class TestReusableBlockSerializerCreate:
     def test_create_saves_instance_and_revision(self, MockReusableBlock):
         """Verify that create saves the instance and creates a revision.
 
-        Purpose: Verify that create calls full_clean, save, and save_revision
-                 in sequence, ensuring revision management on creation.
+        Purpose: Verify that create calls save and save_revision in
+                 sequence, ensuring revision management on creation.
         Type: Normal
         Target: ReusableBlockSerializer.create(validated_data)
         Technique: Equivalence partitioning
@@ -587,16 +538,15 @@ class TestReusableBlockSerializerCreate:
 
         assert result is mock_instance
         MockReusableBlock.assert_called_once_with(**validated_data)
-        mock_instance.full_clean.assert_called_once()
         mock_instance.save.assert_called_once()
         mock_instance.save_revision.assert_called_once()
 
     @mock.patch("wagtail_reusable_blocks.api.serializers.ReusableBlock")
     def test_create_calls_methods_in_order(self, MockReusableBlock):
-        """Verify that create calls full_clean -> save -> save_revision in order.
+        """Verify that create calls save -> save_revision in order.
 
-        Purpose: Verify that the method call order is full_clean -> save ->
-                 save_revision, ensuring validation before save and revision.
+        Purpose: Verify that the method call order is save -> save_revision,
+                 ensuring the instance is persisted before the revision.
         Type: Normal
         Target: ReusableBlockSerializer.create(validated_data)
         Technique: Equivalence partitioning
@@ -604,7 +554,6 @@ class TestReusableBlockSerializerCreate:
         """
         mock_instance = mock.MagicMock()
         call_order = []
-        mock_instance.full_clean.side_effect = lambda: call_order.append("full_clean")
         mock_instance.save.side_effect = lambda: call_order.append("save")
         mock_instance.save_revision.side_effect = lambda: call_order.append(
             "save_revision"
@@ -614,7 +563,7 @@ class TestReusableBlockSerializerCreate:
 
         serializer.create({"name": "Order Test", "slug": "order-test"})
 
-        assert call_order == ["full_clean", "save", "save_revision"]
+        assert call_order == ["save", "save_revision"]
 
 
 class TestReusableBlockSerializerUpdate:
@@ -624,8 +573,8 @@ class TestReusableBlockSerializerUpdate:
         """Verify that update sets attributes, saves, and creates a revision.
 
         Purpose: Verify that update sets attributes on the instance and then
-                 calls full_clean, save, and save_revision, ensuring revision
-                 management on update.
+                 calls save and save_revision, ensuring revision management
+                 on update.
         Type: Normal
         Target: ReusableBlockSerializer.update(instance, validated_data)
         Technique: Equivalence partitioning
@@ -639,7 +588,6 @@ class TestReusableBlockSerializerUpdate:
 
         assert result is mock_instance
         assert mock_instance.name == "Updated Name"
-        mock_instance.full_clean.assert_called_once()
         mock_instance.save.assert_called_once()
         mock_instance.save_revision.assert_called_once()
 
@@ -669,10 +617,10 @@ class TestReusableBlockSerializerUpdate:
         assert mock_instance.content == content_data
 
     def test_update_calls_methods_in_order(self):
-        """Verify that update calls full_clean -> save -> save_revision in order.
+        """Verify that update calls save -> save_revision in order.
 
-        Purpose: Verify that the method call order is full_clean -> save ->
-                 save_revision, ensuring validation before save and revision.
+        Purpose: Verify that the method call order is save -> save_revision,
+                 ensuring the instance is persisted before the revision.
         Type: Normal
         Target: ReusableBlockSerializer.update(instance, validated_data)
         Technique: Equivalence partitioning
@@ -680,7 +628,6 @@ class TestReusableBlockSerializerUpdate:
         """
         mock_instance = mock.MagicMock()
         call_order = []
-        mock_instance.full_clean.side_effect = lambda: call_order.append("full_clean")
         mock_instance.save.side_effect = lambda: call_order.append("save")
         mock_instance.save_revision.side_effect = lambda: call_order.append(
             "save_revision"
@@ -689,7 +636,7 @@ class TestReusableBlockSerializerUpdate:
 
         serializer.update(mock_instance, {"name": "Order Test"})
 
-        assert call_order == ["full_clean", "save", "save_revision"]
+        assert call_order == ["save", "save_revision"]
 
 
 # ---------------------------------------------------------------------------
@@ -896,6 +843,12 @@ class TestReusableBlockModelViewSetGetQueryset:
 class TestReusableBlockModelViewSetPermissions:
     """ReusableBlockModelViewSet permission and authentication tests."""
 
+    @mock.patch.dict(
+        "wagtail_reusable_blocks.api.views._resolved_setting_classes", clear=True
+    )
+    @mock.patch.dict(
+        "wagtail_reusable_blocks.api.views._setting_class_instances", clear=True
+    )
     @mock.patch("wagtail_reusable_blocks.api.views._resolve_classes")
     def test_get_permissions_resolves_from_settings(self, mock_resolve):
         """Verify that get_permissions resolves permission classes from settings.
@@ -919,6 +872,12 @@ class TestReusableBlockModelViewSetPermissions:
         assert len(result) == 1
         assert result[0] is mock_perm_instance
 
+    @mock.patch.dict(
+        "wagtail_reusable_blocks.api.views._resolved_setting_classes", clear=True
+    )
+    @mock.patch.dict(
+        "wagtail_reusable_blocks.api.views._setting_class_instances", clear=True
+    )
     @mock.patch("wagtail_reusable_blocks.api.views._resolve_classes")
     def test_get_permissions_returns_empty_list_when_none(self, mock_resolve):
         """Verify that an empty list is returned when the setting is None.
@@ -938,6 +897,12 @@ class TestReusableBlockModelViewSetPermissions:
 
         assert result == []
 
+    @mock.patch.dict(
+        "wagtail_reusable_blocks.api.views._resolved_setting_classes", clear=True
+    )
+    @mock.patch.dict(
+        "wagtail_reusable_blocks.api.views._setting_class_instances", clear=True
+    )
     @mock.patch("wagtail_reusable_blocks.api.views._resolve_classes")
     @mock.patch(
         "rest_framework.viewsets.ModelViewSet.get_authenticators",
@@ -965,6 +930,12 @@ class TestReusableBlockModelViewSetPermissions:
         mock_super_auth.assert_called_once()
         assert len(result) == 1
 
+    @mock.patch.dict(
+        "wagtail_reusable_blocks.api.views._resolved_setting_classes", clear=True
+    )
+    @mock.patch.dict(
+        "wagtail_reusable_blocks.api.views._setting_class_instances", clear=True
+    )
     @mock.patch("wagtail_reusable_blocks.api.views._resolve_classes")
     def test_get_authenticators_resolves_from_settings(self, mock_resolve):
         """Verify that authentication classes are resolved from settings.
@@ -989,6 +960,12 @@ class TestReusableBlockModelViewSetPermissions:
         assert len(result) == 1
         assert result[0] is mock_auth_instance
 
+    @mock.patch.dict(
+        "wagtail_reusable_blocks.api.views._resolved_setting_classes", clear=True
+    )
+    @mock.patch.dict(
+        "wagtail_reusable_blocks.api.views._setting_class_instances", clear=True
+    )
     @mock.patch("wagtail_reusable_blocks.api.views._resolve_classes")
     def test_get_permissions_instantiates_multiple_classes(self, mock_resolve):
         """Verify that multiple permission classes are all instantiated.
@@ -1126,7 +1103,8 @@ class TestReusableBlockModelViewSetPublish:
         viewset.get_serializer = mock.Mock(return_value=mock_serializer)
         viewset.request = mock_request
 
-        response = viewset.publish(mock_request)
+        with mock.patch("wagtail_reusable_blocks.api.views.transaction"):
+            response = viewset.publish(mock_request)
         return response, mock_instance, mock_request, viewset, mock_revision
 
     def test_publish_creates_revision_then_publishes(self):
@@ -1246,7 +1224,8 @@ class TestReusableBlockModelViewSetPublish:
             mock_serializer,
         )[1]
 
-        viewset.publish(mock_request)
+        with mock.patch("wagtail_reusable_blocks.api.views.transaction"):
+            viewset.publish(mock_request)
 
         assert call_order == [
             "save_revision",
@@ -1279,10 +1258,13 @@ class TestReusableBlockModelViewSetUnpublish:
         viewset.request = mock_request
 
         mock_action_instance = mock.Mock()
-        with mock.patch(
-            "wagtail_reusable_blocks.api.views.UnpublishAction",
-            return_value=mock_action_instance,
-        ) as mock_action_cls:
+        with (
+            mock.patch("wagtail_reusable_blocks.api.views.transaction"),
+            mock.patch(
+                "wagtail_reusable_blocks.api.views.UnpublishAction",
+                return_value=mock_action_instance,
+            ) as mock_action_cls,
+        ):
             response = viewset.unpublish(mock_request)
         return (
             response,
@@ -1339,12 +1321,12 @@ class TestReusableBlockModelViewSetUnpublish:
             skip_permission_checks=True
         )
 
-    def test_unpublish_calls_refresh_from_db(self):
-        """Verify that refresh_from_db() is called after unpublish.
+    def test_unpublish_skips_refresh_from_db(self):
+        """Verify that refresh_from_db() is not called after unpublish.
 
-        Purpose: Verify that the unpublish action refreshes the instance
-                 from the database after unpublishing, ensuring the response
-                 reflects the latest DB state.
+        Purpose: Verify that the unpublish action relies on UnpublishAction
+                 mutating the instance in place instead of re-reading it
+                 from the database, saving one SELECT per call.
         Type: Normal
         Target: ReusableBlockModelViewSet.unpublish(request)
         Technique: Equivalence partitioning
@@ -1359,7 +1341,7 @@ class TestReusableBlockModelViewSetUnpublish:
             _mock_action_instance,
         ) = self._call_unpublish()
 
-        mock_instance.refresh_from_db.assert_called_once()
+        mock_instance.refresh_from_db.assert_not_called()
 
     def test_unpublish_returns_serializer_data(self):
         """Verify that the response body contains serialized instance data.
@@ -1404,12 +1386,12 @@ class TestReusableBlockModelViewSetUnpublish:
 
         assert response.status_code == status.HTTP_200_OK
 
-    def test_unpublish_serializes_refreshed_instance(self):
-        """Verify that get_serializer is called with the refreshed instance.
+    def test_unpublish_serializes_instance(self):
+        """Verify that get_serializer is called with the instance.
 
-        Purpose: Verify that the unpublish action passes the instance
-                 (after refresh_from_db) to get_serializer, ensuring
-                 the serialized response reflects post-unpublish state.
+        Purpose: Verify that the unpublish action passes the (in-place
+                 updated) instance to get_serializer, ensuring the
+                 serialized response reflects post-unpublish state.
         Type: Normal
         Target: ReusableBlockModelViewSet.unpublish(request)
         Technique: Equivalence partitioning
@@ -1427,11 +1409,11 @@ class TestReusableBlockModelViewSetUnpublish:
         viewset.get_serializer.assert_called_once_with(mock_instance)
 
     def test_unpublish_calls_methods_in_order(self):
-        """Verify that UnpublishAction.execute -> refresh_from_db -> get_serializer are called in order.
+        """Verify that UnpublishAction.execute -> get_serializer are called in order.
 
         Purpose: Verify the correct sequence of operations: execute the
-                 unpublish action, refresh from DB, then serialize, ensuring
-                 data consistency in the response.
+                 unpublish action, then serialize, ensuring data
+                 consistency in the response.
         Type: Normal
         Target: ReusableBlockModelViewSet.unpublish(request)
         Technique: Equivalence partitioning
@@ -1451,21 +1433,21 @@ class TestReusableBlockModelViewSetUnpublish:
         mock_action_instance.execute.side_effect = lambda **kw: call_order.append(
             "execute"
         )
-        mock_instance.refresh_from_db.side_effect = lambda: call_order.append(
-            "refresh_from_db"
-        )
         viewset.get_serializer.side_effect = lambda inst: (
             call_order.append("get_serializer"),
             mock_serializer,
         )[1]
 
-        with mock.patch(
-            "wagtail_reusable_blocks.api.views.UnpublishAction",
-            return_value=mock_action_instance,
+        with (
+            mock.patch("wagtail_reusable_blocks.api.views.transaction"),
+            mock.patch(
+                "wagtail_reusable_blocks.api.views.UnpublishAction",
+                return_value=mock_action_instance,
+            ),
         ):
             viewset.unpublish(mock_request)
 
-        assert call_order == ["execute", "refresh_from_db", "get_serializer"]
+        assert call_order == ["execute", "get_serializer"]
 
 
 # ---------------------------------------------------------------------------
@@ -1521,7 +1503,7 @@ class TestReusableBlockModelViewSetRender:
 
         response = viewset.render(mock_request)
 
-        assert response.data == {"html": "<div>Content</div>"}
+        assert json.loads(response.content) == {"html": "<div>Content</div>"}
 
     def test_render_returns_200_status(self):
         """Verify that the response status code is 200 OK on success.
@@ -1575,7 +1557,7 @@ class TestReusableBlockModelViewSetRender:
 
         response = viewset.render(mock_request)
 
-        assert response.data == {"detail": "Invalid block data"}
+        assert json.loads(response.content) == {"detail": "Invalid block data"}
 
     def test_render_returns_empty_html_string(self):
         """Verify that an empty HTML string is returned correctly.
@@ -1593,5 +1575,5 @@ class TestReusableBlockModelViewSetRender:
 
         response = viewset.render(mock_request)
 
-        assert response.data == {"html": ""}
+        assert json.loads(response.content) == {"html": ""}
         assert response.status_code == status.HTTP_200_OK
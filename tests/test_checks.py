@@ -0,0 +1,51 @@
+"""Tests for system checks."""
+
+from django.test import override_settings
+
+from wagtail_reusable_blocks.checks import check_cached_template_loader
+
+
+class TestCachedTemplateLoaderCheck:
+    """Tests for the W001 cached-template-loader warning."""
+
+    def test_default_loaders_pass(self):
+        """Engines without an explicit 'loaders' option raise no warning."""
+        assert check_cached_template_loader(None) == []
+
+    def test_uncached_loaders_warn(self):
+        """Explicit loaders without the cached loader produce W001."""
+        templates = [
+            {
+                "BACKEND": "django.template.backends.django.DjangoTemplates",
+                "DIRS": [],
+                "OPTIONS": {
+                    "loaders": ["django.template.loaders.filesystem.Loader"],
+                },
+            }
+        ]
+        with override_settings(TEMPLATES=templates):
+            warnings = check_cached_template_loader(None)
+
+        assert len(warnings) == 1
+        assert warnings[0].id == "wagtail_reusable_blocks.W001"
+
+    def test_cached_loader_passes(self):
+        """Loaders wrapped in the cached loader raise no warning."""
+        templates = [
+            {
+                "BACKEND": "django.template.backends.django.DjangoTemplates",
+                "DIRS": [],
+                "OPTIONS": {
+                    "loaders": [
+                        (
+                            "django.template.loaders.cached.Loader",
+                            ["django.template.loaders.filesystem.Loader"],
+                        ),
+                    ],
+                },
+            }
+        ]
+        with override_settings(TEMPLATES=templates):
+            warnings = check_cached_template_loader(None)
+
+        assert warnings == []
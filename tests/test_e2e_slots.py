@@ -468,3 +468,42 @@ class TestSlotBasedTemplatingE2E:
         html = block.render(value)
 
         assert "Click Here!" in html
+
+    def test_slot_fill_markup_has_no_stream_block_wrappers(self):
+        """Slot fills are injected without StreamBlock's block-TYPE wrappers."""
+        layout = ReusableBlock.objects.create(
+            name="Wrapper Check Layout",
+            content=[
+                {
+                    "type": "raw_html",
+                    "value": "<div data-slot='main'></div>",
+                }
+            ],
+        )
+
+        block = ReusableLayoutBlock()
+
+        value = block.to_python(
+            {
+                "layout": layout.pk,
+                "slot_content": [
+                    {
+                        "type": "slot_fill",
+                        "value": {
+                            "slot_id": "main",
+                            "content": [
+                                {"type": "raw_html", "value": "<span>Filled</span>"},
+                            ],
+                        },
+                    }
+                ],
+            }
+        )
+
+        html = block.render(value)
+
+        # Slot children render and join directly; render_as_block would
+        # wrap the fill in a <div class="... block-raw_html"> shim inside
+        # the slot element. (The layout's own top-level wrapper is
+        # unrelated baseline StreamField markup.)
+        assert '<div data-slot="main"><span>Filled</span></div>' in html
@@ -157,6 +157,15 @@ class TestReusableLayoutBlock:
         html = block.render(value)
         assert "Static content" in html
 
+    @pytest.mark.django_db
+    def test_render_without_layout_returns_empty(self):
+        """Rendering with no layout selected returns an empty string."""
+        block = ReusableLayoutBlock()
+        value = block.to_python({"layout": None, "slot_content": []})
+
+        html = block.render(value)
+        assert html == ""
+
     @pytest.mark.django_db
     def test_multiple_slot_fills(self):
         """Can have multiple slot_fill blocks."""
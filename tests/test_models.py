@@ -261,3 +261,157 @@ class TestReusableBlockCRUD:
 
         assert result.count() == 1
         assert result.first().name == "Block 1"  # type: ignore[union-attr]
+
+
+class TestReusableBlockSlotIds:
+    """Tests for the slot_ids column maintained at save time."""
+
+    @pytest.mark.django_db
+    def test_slot_ids_populated_on_save(self):
+        """Saving detects slots from the rendered content."""
+        block = ReusableBlock.objects.create(
+            name="Layout Block",
+            content=[
+                {
+                    "type": "raw_html",
+                    "value": (
+                        '<div data-slot="header" data-slot-label="Header"></div>'
+                        '<div data-slot="main"><p>Default</p></div>'
+                    ),
+                },
+            ],
+        )
+
+        assert [slot["id"] for slot in block.slot_ids] == ["header", "main"]
+        assert block.slot_ids[0]["label"] == "Header"
+        assert block.slot_ids[1]["has_default"] is True
+
+    @pytest.mark.django_db
+    def test_slot_ids_empty_without_slots(self):
+        """Content without slot elements stores an empty list."""
+        block = ReusableBlock.objects.create(
+            name="Plain Block",
+            content=[{"type": "rich_text", "value": "<p>No slots here</p>"}],
+        )
+
+        assert block.slot_ids == []
+
+    @pytest.mark.django_db
+    def test_slot_ids_refreshed_on_content_change(self):
+        """Changing content and saving refreshes the stored slots."""
+        block = ReusableBlock.objects.create(
+            name="Changing Block",
+            content=[{"type": "raw_html", "value": '<div data-slot="old"></div>'}],
+        )
+
+        block.content = [
+            {"type": "raw_html", "value": '<div data-slot="new"></div>'}
+        ]
+        block.save()
+        block.refresh_from_db()
+
+        assert [slot["id"] for slot in block.slot_ids] == ["new"]
+
+
+def prefixed_slugify(name):
+    """Slugify backend used by TestSlugifyBackend."""
+    from django.utils.text import slugify
+
+    return f"custom-{slugify(name)}"
+
+
+class TestSlugifyBackend:
+    """Tests for the SLUGIFY_BACKEND setting."""
+
+    @pytest.mark.django_db
+    def test_custom_backend_used_for_slug_generation(self):
+        """A configured backend generates the slug instead of slugify."""
+        from django.test import override_settings
+
+        with override_settings(
+            WAGTAIL_REUSABLE_BLOCKS={
+                "SLUGIFY_BACKEND": "tests.test_models.prefixed_slugify",
+            }
+        ):
+            block = ReusableBlock.objects.create(name="Backend Test")
+
+        assert block.slug == "custom-backend-test"
+
+    @pytest.mark.django_db
+    def test_default_backend_is_django_slugify(self):
+        """Without the setting, slugs come from Django's slugify."""
+        block = ReusableBlock.objects.create(name="Default Backend Test")
+
+        assert block.slug == "default-backend-test"
+
+
+class TestReusableBlockManager:
+    """Tests for ReusableBlockManager query helpers."""
+
+    @pytest.mark.django_db
+    def test_for_render_defers_unneeded_fields(self):
+        """for_render() loads only the fields rendering touches."""
+        ReusableBlock.objects.create(name="Manager Test")
+
+        block = ReusableBlock.objects.for_render().get(slug="manager-test")
+
+        deferred = block.get_deferred_fields()
+        assert "slot_ids" in deferred
+        assert "content" not in deferred
+
+    @pytest.mark.django_db
+    def test_render_many_returns_html_per_pk(self):
+        """render_many renders each block keyed by primary key."""
+        from wagtail_reusable_blocks.models import render_many
+
+        first = ReusableBlock.objects.create(
+            name="Many One",
+            content=[{"type": "raw_html", "value": "<p>one</p>"}],
+        )
+        second = ReusableBlock.objects.create(
+            name="Many Two",
+            content=[{"type": "raw_html", "value": "<p>two</p>"}],
+        )
+
+        rendered = render_many(ReusableBlock.objects.for_render())
+
+        assert "<p>one</p>" in rendered[first.pk]
+        assert "<p>two</p>" in rendered[second.pk]
+
+
+class TestSlugRefillOnSave:
+    """Tests for refilling a blank slug on save."""
+
+    @pytest.mark.django_db
+    def test_resave_with_blank_slug_refills_from_name(self):
+        """Re-saving a loaded block with a cleared slug regenerates it."""
+        ReusableBlock.objects.create(name="Refill Slug Test")
+
+        block = ReusableBlock.objects.get(slug="refill-slug-test")
+        block.slug = ""
+        block.save()
+
+        assert block.slug == "refill-slug-test"
+
+    @pytest.mark.django_db
+    def test_resave_with_changed_name_regenerates_slug(self):
+        """Clearing the slug and renaming regenerates from the new name."""
+        ReusableBlock.objects.create(name="Rename Slug Test")
+
+        block = ReusableBlock.objects.get(slug="rename-slug-test")
+        block.slug = ""
+        block.name = "Renamed Block"
+        block.save()
+
+        assert block.slug == "renamed-block"
+
+    @pytest.mark.django_db
+    def test_existing_slug_is_preserved_on_resave(self):
+        """A non-blank slug is never regenerated, even after a rename."""
+        ReusableBlock.objects.create(name="Keep Slug Test")
+
+        block = ReusableBlock.objects.get(slug="keep-slug-test")
+        block.name = "Renamed Keep Slug Test"
+        block.save()
+
+        assert block.slug == "keep-slug-test"
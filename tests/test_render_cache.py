@@ -0,0 +1,155 @@
+"""Tests for the layout render cache."""
+
+from unittest import mock
+
+import pytest
+from django.test import override_settings
+
+from wagtail_reusable_blocks.models import ReusableBlock
+from wagtail_reusable_blocks.utils import get_cached_layout_html, get_cached_slots
+
+# The test settings use DummyCache; cache-hit assertions need a real backend.
+LOCMEM_CACHE = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+
+@pytest.mark.django_db
+class TestGetCachedLayoutHtml:
+    """Tests for get_cached_layout_html."""
+
+    def _make_layout(self, name):
+        return ReusableBlock.objects.create(
+            name=name,
+            content=[
+                {
+                    "type": "raw_html",
+                    "value": '<div data-slot="main"><p>Default</p></div>',
+                }
+            ],
+        )
+
+    def test_returns_rendered_html(self):
+        """Returns the rendered content StreamField HTML."""
+        layout = self._make_layout("Cache Render Test")
+        html = get_cached_layout_html(layout)
+
+        assert 'data-slot="main"' in html
+
+    @override_settings(CACHES=LOCMEM_CACHE)
+    def test_second_call_skips_render(self):
+        """A second call for the same (pk, updated_at) hits the cache."""
+        layout = self._make_layout("Cache Hit Test")
+        first = get_cached_layout_html(layout)
+
+        with mock.patch.object(
+            type(layout.content), "render_as_block"
+        ) as mock_render:
+            second = get_cached_layout_html(layout)
+
+        mock_render.assert_not_called()
+        assert second == first
+
+    @override_settings(CACHES=LOCMEM_CACHE)
+    def test_save_invalidates_cache(self):
+        """Saving the block rotates updated_at, so the cache misses."""
+        layout = self._make_layout("Cache Invalidation Test")
+        get_cached_layout_html(layout)
+
+        layout.content = [
+            {"type": "raw_html", "value": '<div data-slot="other"></div>'}
+        ]
+        layout.save()
+
+        html = get_cached_layout_html(layout)
+        assert 'data-slot="other"' in html
+
+
+@pytest.mark.django_db
+class TestGetCachedSlots:
+    """Tests for get_cached_slots."""
+
+    def test_returns_detected_slots(self):
+        """Returns the slot list detected from the rendered layout."""
+        layout = ReusableBlock.objects.create(
+            name="Cached Slots Test",
+            content=[
+                {
+                    "type": "raw_html",
+                    "value": (
+                        '<div data-slot="header" data-slot-label="Header"></div>'
+                        '<div data-slot="main"><p>Default</p></div>'
+                    ),
+                }
+            ],
+        )
+
+        slots = get_cached_slots(layout)
+
+        assert [slot["id"] for slot in slots] == ["header", "main"]
+        assert slots[0]["label"] == "Header"
+        assert slots[1]["has_default"] is True
+
+    @override_settings(CACHES=LOCMEM_CACHE)
+    def test_second_call_skips_render_and_parse(self):
+        """A second call serves the slot list from the cache."""
+        layout = ReusableBlock.objects.create(
+            name="Cached Slots Hit Test",
+            content=[
+                {"type": "raw_html", "value": '<div data-slot="main"></div>'}
+            ],
+        )
+        first = get_cached_slots(layout)
+
+        with mock.patch(
+            "wagtail_reusable_blocks.utils.render_cache.detect_slots_from_html"
+        ) as mock_detect:
+            second = get_cached_slots(layout)
+
+        mock_detect.assert_not_called()
+        assert second == first
+
+
+@pytest.mark.django_db
+class TestRequestScopedLayoutCache:
+    """Tests for the per-request layout memo."""
+
+    def _make_layout(self, name):
+        return ReusableBlock.objects.create(
+            name=name,
+            content=[{"type": "rich_text", "value": "<p>Request scoped</p>"}],
+        )
+
+    def test_memoizes_within_request(self):
+        """Inside a request, repeat renders are served from the memo."""
+        from wagtail_reusable_blocks.utils import render_cache
+
+        layout = self._make_layout("Request Memo Test")
+        render_cache._start_request_cache(sender=None)
+        try:
+            first = get_cached_layout_html(layout)
+            with mock.patch.object(
+                type(layout.content), "render_as_block"
+            ) as mock_render:
+                second = get_cached_layout_html(layout)
+            mock_render.assert_not_called()
+            assert second == first
+        finally:
+            render_cache._drop_request_cache(sender=None)
+
+    def test_memo_released_after_request(self):
+        """After the request ends, rendering happens again (DummyCache)."""
+        from wagtail_reusable_blocks.utils import render_cache
+
+        layout = self._make_layout("Request Memo Release Test")
+        render_cache._start_request_cache(sender=None)
+        get_cached_layout_html(layout)
+        render_cache._drop_request_cache(sender=None)
+
+        with mock.patch.object(
+            type(layout.content), "render_as_block", return_value="<p>again</p>"
+        ) as mock_render:
+            html = get_cached_layout_html(layout)
+
+        mock_render.assert_called_once()
+        assert html == "<p>again</p>"
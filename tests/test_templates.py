@@ -213,3 +213,106 @@ class TestTemplateContextVariables:
             )
 
         assert "test|Context Test" in html
+
+
+class TestRenderCaching:
+    """Tests for the context-free render cache on ReusableBlock.render()."""
+
+    # The test settings use DummyCache; cache-hit assertions need a real one.
+    LOCMEM_CACHE = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+
+    @pytest.fixture
+    def block(self, db):
+        """Create a test ReusableBlock."""
+        return ReusableBlock.objects.create(
+            name="Cached Render Block",
+            content=[
+                ("rich_text", "<p>Cached content</p>"),
+            ],
+        )
+
+    @override_settings(CACHES=LOCMEM_CACHE)
+    def test_context_free_render_is_cached(self, block):
+        """A second context-free render skips the template engine."""
+        from unittest import mock
+
+        first = block.render()
+
+        with mock.patch(
+            "wagtail_reusable_blocks.models.reusable_block._get_cached_template"
+        ) as mock_get_template:
+            second = block.render()
+
+        mock_get_template.assert_not_called()
+        assert str(second) == str(first)
+
+    @override_settings(CACHES=LOCMEM_CACHE)
+    def test_render_with_context_is_not_cached(self, block):
+        """Renders with a caller context always hit the template engine."""
+        from unittest import mock
+
+        block.render()
+
+        with mock.patch(
+            "wagtail_reusable_blocks.models.reusable_block._get_cached_template"
+        ) as mock_get_template:
+            mock_get_template.return_value.render.return_value = "<p>fresh</p>"
+            html = block.render(context={"page_title": "A"})
+
+        mock_get_template.assert_called_once()
+        assert "fresh" in html
+
+    @override_settings(CACHES=LOCMEM_CACHE)
+    def test_save_invalidates_render_cache(self, block):
+        """Saving rotates updated_at, so the next render re-renders."""
+        block.render()
+
+        block.content = [("rich_text", "<p>Updated content</p>")]
+        block.save()
+
+        html = block.render()
+        assert "Updated content" in html
+
+
+class TestRenderLocalLRU:
+    """Tests for the in-process L1 render cache in front of the Django cache."""
+
+    @pytest.fixture
+    def block(self, db):
+        """Create a test ReusableBlock."""
+        return ReusableBlock.objects.create(
+            name="Local LRU Block",
+            content=[
+                ("rich_text", "<p>Local content</p>"),
+            ],
+        )
+
+    def test_repeat_render_served_from_local_lru(self, block):
+        """A second render is served in-process even without a cache backend.
+
+        The test settings use DummyCache, so a hit here can only come
+        from the local LRU layer.
+        """
+        from unittest import mock
+
+        first = block.render()
+
+        with mock.patch(
+            "wagtail_reusable_blocks.models.reusable_block._get_cached_template"
+        ) as mock_get_template:
+            second = block.render()
+
+        mock_get_template.assert_not_called()
+        assert str(second) == str(first)
+
+    def test_save_rotates_local_lru_key(self, block):
+        """Saving changes updated_at, so the local entry is bypassed."""
+        block.render()
+
+        block.content = [("rich_text", "<p>Updated local content</p>")]
+        block.save()
+
+        html = block.render()
+        assert "Updated local content" in html
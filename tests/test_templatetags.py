@@ -2,7 +2,11 @@
 
 from unittest.mock import MagicMock
 
-from wagtail_reusable_blocks.templatetags.reusable_blocks_tags import is_gif
+from wagtail_reusable_blocks.templatetags.reusable_blocks_tags import (
+    image_flags,
+    image_format,
+    is_gif,
+)
 
 
 class TestIsGifFilter:
@@ -52,3 +56,44 @@ class TestIsGifFilter:
         image = MagicMock()
         image.file.name = "images/2024/01/animation.gif"
         assert is_gif(image) is True
+
+
+class TestImageFormatFilter:
+    """Tests for the image_format template filter."""
+
+    def test_returns_lowercased_extension(self):
+        """image_format returns the extension without the dot, lowercased."""
+        image = MagicMock()
+        image.file.name = "test_image.PNG"
+        assert image_format(image) == "png"
+
+    def test_none_image_returns_empty_string(self):
+        """image_format returns '' for None."""
+        assert image_format(None) == ""
+
+    def test_image_with_none_file_returns_empty_string(self):
+        """image_format returns '' when image.file is None."""
+        image = MagicMock()
+        image.file = None
+        assert image_format(image) == ""
+
+    def test_file_without_extension_returns_empty_string(self):
+        """image_format returns '' for extensionless filenames."""
+        image = MagicMock()
+        image.file.name = "images/no_extension"
+        assert image_format(image) == ""
+
+
+class TestImageFlagsTag:
+    """Tests for the image_flags simple tag."""
+
+    def test_returns_ext_and_gif_flag(self):
+        """image_flags resolves extension and GIF flag in one call."""
+        image = MagicMock()
+        image.file.name = "banner.gif"
+        flags = image_flags(image)
+        assert flags == {"ext": "gif", "is_gif": True}
+
+    def test_none_image_returns_empty_flags(self):
+        """image_flags handles a missing image."""
+        assert image_flags(None) == {"ext": "", "is_gif": False}